@@ -4,7 +4,11 @@ PSA Agent Backend - Multi-Agent System
 
 from .orchestrator import run as orchestrator_run
 from .project_management import handle_project_management, project_management_agent
-from .resource_management import handle_resource_management, resource_management_agent
+from .resource_management import (
+    handle_resource_management,
+    resource_management_agent,
+    stream_resource_management,
+)
 
 __all__ = [
     "orchestrator_run",
@@ -12,4 +16,5 @@ __all__ = [
     "project_management_agent",
     "handle_resource_management",
     "resource_management_agent",
+    "stream_resource_management",
 ]
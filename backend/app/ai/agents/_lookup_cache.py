@@ -0,0 +1,97 @@
+"""
+Short-lived cache of task and staffer display names used in event messages
+"""
+
+import asyncio
+from typing import Optional
+
+from cachetools import TTLCache
+
+from ...utils.db_errors import run_query
+from ...utils.formatting import format_staffer_name
+from ...utils.supabase_client import supabase_client
+
+# Keyed by (table, id). Names rarely change and reassignment flows look up the
+# same ids repeatedly, so a minute of staleness is fine for display text
+_name_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_name_cache_lock = asyncio.Lock()
+
+
+async def _get_cached(key: tuple) -> Optional[str]:
+    async with _name_cache_lock:
+        return _name_cache.get(key)
+
+
+async def _set_cached(key: tuple, name: str) -> None:
+    async with _name_cache_lock:
+        _name_cache[key] = name
+
+
+async def remember_task_name(task_id: str, task_name: str) -> None:
+    """Cache a task name already known from a write, skipping a later lookup."""
+    await _set_cached(("project_tasks", task_id), task_name)
+
+
+async def remember_staffer_name(staffer_id: str, staffer_name: str) -> None:
+    """Cache a staffer name already known from a write, skipping a later lookup."""
+    await _set_cached(("staffers", staffer_id), staffer_name)
+
+
+async def get_task_name(task_id: str) -> str:
+    """
+    Get a task's name for display, falling back to the id if it can't be found.
+
+    Args:
+        task_id: ID of the task
+
+    Returns:
+        str: Task name, or task_id if the task doesn't exist
+    """
+    key = ("project_tasks", task_id)
+    name = await _get_cached(key)
+    if name is not None:
+        return name
+
+    result = await run_query(
+        supabase_client.table("project_tasks")
+        .select("project_task_name")
+        .eq("project_task_id", task_id)
+        .execute
+    )
+    if not result.data:
+        return task_id
+
+    name = result.data[0]["project_task_name"]
+    await _set_cached(key, name)
+    return name
+
+
+async def get_staffer_name(staffer_id: str) -> str:
+    """
+    Get a staffer's full name for display, falling back to the id if it can't
+    be found.
+
+    Args:
+        staffer_id: ID of the staffer
+
+    Returns:
+        str: Staffer name, or staffer_id if the staffer doesn't exist
+    """
+    key = ("staffers", staffer_id)
+    name = await _get_cached(key)
+    if name is not None:
+        return name
+
+    result = await run_query(
+        supabase_client.table("staffers")
+        .select("first_name, last_name")
+        .eq("id", staffer_id)
+        .execute
+    )
+    if not result.data:
+        return staffer_id
+
+    staffer = result.data[0]
+    name = format_staffer_name(staffer["first_name"], staffer["last_name"], staffer_id)
+    await _set_cached(key, name)
+    return name
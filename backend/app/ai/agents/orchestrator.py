@@ -1,8 +1,12 @@
+import logging
+import re
+from functools import lru_cache
+
 from agents import Agent, ItemHelpers, Runner
 
-from ...events.bus import AgentType, BusinessEvent, BusinessEventType, event_bus
+from ...events.bus import AgentType, BusinessEvent, BusinessEventType, EventBatcher
 from .project_management import handle_project_management, project_management_agent
-from .resource_management import handle_resource_management, resource_management_agent
+from .resource_management import resource_management_agent
 
 MAIN_SYSTEM_PROMPT = """
 You are an assistant that routes queries to specialized agents based on the content and intent of the user's request.
@@ -38,166 +42,236 @@ The resource_management_agent specializes in staffer reassignment scenarios and
 """
 
 
-# Create the orchestrator using the specialized agents as tools
-orchestrator = Agent(
-    name="orchestrator",
-    model="gpt-4o-mini",
-    instructions=MAIN_SYSTEM_PROMPT,
-    tools=[
-        project_management_agent.as_tool(
-            tool_name="project_management_agent",
-            tool_description="Handle project management queries including planning, tasks, phases, and project tracking",
-        ),
-        resource_management_agent.as_tool(
-            tool_name="resource_management_agent",
-            tool_description="Handle resource allocation, staffer assignments, and time-off reassignment scenarios",
-        ),
-    ],
+@lru_cache(maxsize=1)
+def get_orchestrator() -> Agent:
+    """
+    Build the orchestrator agent on first use, with the specialized agents as
+    tools, and reuse the same instance for every run.
+    """
+    return Agent(
+        name="orchestrator",
+        model="gpt-4o-mini",
+        instructions=MAIN_SYSTEM_PROMPT,
+        tools=[
+            project_management_agent.as_tool(
+                tool_name="project_management_agent",
+                tool_description="Handle project management queries including planning, tasks, phases, and project tracking",
+            ),
+            resource_management_agent.as_tool(
+                tool_name="resource_management_agent",
+                tool_description="Handle resource allocation, staffer assignments, and time-off reassignment scenarios",
+            ),
+        ],
+    )
+
+
+logger = logging.getLogger(__name__)
+
+# Queries that mention only project-side actions can go straight to the project
+# management agent. Anything touching staffing, time off or assignments is
+# left to the orchestrator, since those flows may need both agents
+_PROJECT_KEYWORDS = re.compile(
+    r"\b(status|due date|deadline|phase|milestone|task)", re.IGNORECASE
+)
+_RESOURCE_KEYWORDS = re.compile(
+    r"\b(staffer|assign|reassign|time[- ]off|pto|vacation|sick|leave|absen"
+    r"|availab|capacity|workload|replace|cover)",
+    re.IGNORECASE,
 )
 
 
-async def run(query: str):
-    """
-    Run the orchestrator with a query, stream events, and emit results through the event bus.
+def _is_direct_project_query(query: str) -> bool:
+    """Check whether a query unambiguously belongs to the project agent."""
+    if _RESOURCE_KEYWORDS.search(query):
+        return False
+    return _PROJECT_KEYWORDS.search(query) is not None
 
-    Args:
-        query: The user's query to process
 
-    Returns:
-        str: The orchestrator's response to the query
-    """
+def _tool_call_info(item) -> tuple:
+    """Extract (tool_name, tool_args) from a tool_call_item's raw_item."""
+    tool_name = "unknown_tool"
+    tool_args = {}
+
     try:
-        # Run the orchestrator agent with streaming
-        result = Runner.run_streamed(starting_agent=orchestrator, input=query)
-
-        print(f"=== Orchestrator Run Starting for query: {query[:100]}... ===")
-
-        final_result = None
-
-        # Stream and process events
-        async for event in result.stream_events():
-            # Ignore raw response events (token-by-token updates)
-            if event.type == "raw_response_event":
-                continue
-
-            # Handle agent updates (when agents hand off to each other)
-            elif event.type == "agent_updated_stream_event":
-                agent_name = (
-                    event.new_agent.name if hasattr(event, "new_agent") else "unknown"
-                )
-                print(f"🔄 Agent handoff: Now using {agent_name}")
-
-                await event_bus.emit(
-                    BusinessEvent(
-                        type=BusinessEventType.TEST,
-                        message=f"Agent handoff: Now using {agent_name}",
-                        agent_id=AgentType.ORCHESTRATOR,
+        # The tool information is in the raw_item according to the SDK docs
+        raw_item = getattr(item, "raw_item", None)
+        if raw_item:
+            # For function tools, look for 'function' attribute
+            if hasattr(raw_item, "function") and raw_item.function:
+                if hasattr(raw_item.function, "name"):
+                    tool_name = raw_item.function.name
+                if hasattr(raw_item.function, "arguments"):
+                    tool_args = raw_item.function.arguments
+            # Also try direct name attribute on raw_item
+            elif hasattr(raw_item, "name"):
+                tool_name = raw_item.name
+            # Try other possible attributes
+            elif hasattr(raw_item, "tool_name"):
+                tool_name = raw_item.tool_name
+
+            # Try to get arguments if not found yet
+            if not tool_args and hasattr(raw_item, "arguments"):
+                tool_args = raw_item.arguments
+
+    except Exception as e:
+        logger.debug(
+            "Error extracting tool info: %s (raw item type: %s)",
+            e,
+            type(getattr(item, "raw_item", None)),
+        )
+
+    return tool_name, tool_args
+
+
+async def _stream_orchestrator(query: str, events: EventBatcher) -> str:
+    """Run the orchestrator agent with streaming and return its final message."""
+    # Run the orchestrator agent with streaming
+    result = Runner.run_streamed(starting_agent=get_orchestrator(), input=query)
+
+    logger.info("Orchestrator run starting for query: %.100s", query)
+
+    # Only the last message item becomes the result, so keep the item and
+    # extract its text once after the stream ends
+    last_message_item = None
+
+    # Stream and process events
+    async for event in result.stream_events():
+        # Ignore raw response events (token-by-token updates)
+        if event.type == "raw_response_event":
+            continue
+
+        # Handle agent updates (when agents hand off to each other)
+        elif event.type == "agent_updated_stream_event":
+            agent_name = (
+                event.new_agent.name if hasattr(event, "new_agent") else "unknown"
+            )
+            logger.info("Agent handoff: now using %s", agent_name)
+
+            await events.add(
+                BusinessEvent(
+                    type=BusinessEventType.HANDOFF,
+                    message=f"Agent handoff: Now using {agent_name}",
+                    agent_id=AgentType.ORCHESTRATOR,
+                ),
+            )
+
+        # Handle run item events (tool calls, messages, etc.)
+        elif event.type == "run_item_stream_event":
+            if event.item.type == "tool_call_item":
+                # Tool details are only used for debug logging and events, so
+                # skip the attribute probing entirely when DEBUG is off
+                if logger.isEnabledFor(logging.DEBUG):
+                    tool_name, tool_args = _tool_call_info(event.item)
+                    logger.debug("Tool called: %s with args: %s", tool_name, tool_args)
+                    await events.add(
+                        BusinessEvent(
+                            type=BusinessEventType.TOOL_CALL,
+                            message=f"Tool called: {tool_name} with args: {str(tool_args)[:200]}",
+                            agent_id=AgentType.ORCHESTRATOR,
+                        ),
+                    )
+
+            elif event.item.type == "tool_call_output_item":
+                if logger.isEnabledFor(logging.DEBUG):
+                    tool_output = str(getattr(event.item, "output", "No output"))
+                    logger.debug("Tool output: %.200s", tool_output)
+                    await events.add(
+                        BusinessEvent(
+                            type=BusinessEventType.TOOL_OUTPUT,
+                            message=f"Tool output received: {tool_output[:200]}",
+                            agent_id=AgentType.ORCHESTRATOR,
+                        ),
                     )
-                )
-
-            # Handle run item events (tool calls, messages, etc.)
-            elif event.type == "run_item_stream_event":
-                if event.item.type == "tool_call_item":
-                    # Extract tool name from the raw_item according to OpenAI Agents SDK structure
-                    tool_name = "unknown_tool"
-                    tool_args = {}
-
-                    try:
-                        # The tool information is in the raw_item according to the SDK docs
-                        if hasattr(event.item, "raw_item") and event.item.raw_item:
-                            raw_item = event.item.raw_item
-
-                            # For function tools, look for 'function' attribute
-                            if hasattr(raw_item, "function") and raw_item.function:
-                                if hasattr(raw_item.function, "name"):
-                                    tool_name = raw_item.function.name
-                                if hasattr(raw_item.function, "arguments"):
-                                    tool_args = raw_item.function.arguments
-                            # Also try direct name attribute on raw_item
-                            elif hasattr(raw_item, "name"):
-                                tool_name = raw_item.name
-                            # Try other possible attributes
-                            elif hasattr(raw_item, "tool_name"):
-                                tool_name = raw_item.tool_name
-
-                            # Try to get arguments if not found yet
-                            if not tool_args and hasattr(raw_item, "arguments"):
-                                tool_args = raw_item.arguments
-
-                    except Exception as e:
-                        print(f"🔍 Debug - Error extracting tool info: {e}")
-                        print(
-                            f"🔍 Debug - Raw item type: {type(event.item.raw_item) if hasattr(event.item, 'raw_item') else 'No raw_item'}"
-                        )
-
-                    print(f"🔧 Tool Called: {tool_name}")
-                    print(f"   Arguments: {tool_args}")
-
-                    # await event_bus.emit(
-                    #     BusinessEvent(
-                    #         type=BusinessEventType.TEST,
-                    #         message=f"Tool called: {tool_name} with args: {tool_args}",
-                    #         agent_id=AgentType.PROJECT,
-                    #     )
-                    # )
-
-                elif event.item.type == "tool_call_output_item":
-                    tool_output = (
-                        str(event.item.output)[:200]
-                        if hasattr(event.item, "output")
-                        else "No output"
+
+            elif event.item.type == "message_output_item":
+                last_message_item = event.item
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    message = ItemHelpers.text_message_output(event.item)
+                    logger.debug("Agent message generated: %.200s", message)
+                    await events.add(
+                        BusinessEvent(
+                            type=BusinessEventType.AGENT_MESSAGE,
+                            message=f"Agent message: {message[:200]}",
+                            agent_id=AgentType.ORCHESTRATOR,
+                        ),
                     )
 
-                    print(f"✅ Tool Output: {tool_output}...")
+            else:
+                logger.debug("Other item type: %s", event.item.type)
+
+    logger.info("Orchestrator run complete")
 
-                    # await event_bus.emit(
-                    #     BusinessEvent(
-                    #         type=BusinessEventType.TEST,
-                    #         message=f"Tool output received: {tool_output}...",
-                    #         agent_id=AgentType.PROJECT,
-                    #     )
-                    # )
+    # Get the final result from the completed run
+    if last_message_item is not None:
+        return ItemHelpers.text_message_output(last_message_item)
+    # The stream has finished, so the run's final output is available
+    return str(result.final_output)
 
-                elif event.item.type == "message_output_item":
-                    message_text = ItemHelpers.text_message_output(event.item)
 
-                    print(f"💬 Agent Message Generated:")
-                    print(f"   {message_text[:200]}...")
+async def run(query: str, *, stream: bool = False):
+    """
+    Run the orchestrator with a query and emit results through the event bus.
 
-                    # Store the final result
-                    final_result = message_text
+    Args:
+        query: The user's query to process
+        stream: If True, stream the run and emit progress events (such as agent
+            handoffs) as they happen. Callers that only need the final answer
+            should leave this off to skip the per-event loop
 
-                else:
-                    print(f"📝 Other item type: {event.item.type}")
+    Returns:
+        str: The orchestrator's response to the query
+    """
+    # Events are buffered and delivered in small batches so slow subscribers
+    # don't stall the agent stream
+    events = EventBatcher()
 
-        print("=== Orchestrator Run Complete ===")
+    try:
+        await events.add(
+            BusinessEvent(
+                type=BusinessEventType.ORCHESTRATOR_START,
+                message=f"Processing query: {query[:200]}",
+                agent_id=AgentType.ORCHESTRATOR,
+            ),
+        )
 
-        # Get the final result from the completed run
-        if final_result is None:
-            final_result = str(await result.get_result())
+        if _is_direct_project_query(query):
+            # Skip the routing LLM call when only the project agent applies
+            logger.info("Routing directly to project management: %.100s", query)
+            final_result = await handle_project_management(query)
+        elif stream:
+            final_result = await _stream_orchestrator(query, events)
+        else:
+            logger.info("Orchestrator run starting for query: %.100s", query)
+            result = await Runner.run(starting_agent=get_orchestrator(), input=query)
+            final_result = str(result.final_output)
 
         # Emit final success event
-        await event_bus.emit(
+        await events.add(
             BusinessEvent(
-                type=BusinessEventType.TEST,
-                message=f"Query processed successfully: {str(final_result)[:200]}...",
+                type=BusinessEventType.ORCHESTRATOR_END,
+                message=f"Query processed successfully: {final_result[:200]}...",
                 agent_id=AgentType.ORCHESTRATOR,
-            )
+            ),
         )
 
         # Return the actual result
-        return str(final_result)
+        return final_result
 
     except Exception as e:
-        print(f"❌ Error in orchestrator: {str(e)}")
+        logger.exception("Error in orchestrator: %s", e)
 
         # Emit error event
-        await event_bus.emit(
+        await events.add(
             BusinessEvent(
                 type=BusinessEventType.ERROR,
                 message=f"Error processing query: {str(e)}",
                 agent_id=AgentType.ORCHESTRATOR,
-            )
+            ),
         )
         # Re-raise the exception so the caller can handle it
         raise e
+
+    finally:
+        # Flush pending events before returning
+        await events.flush()
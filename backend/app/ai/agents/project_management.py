@@ -2,29 +2,38 @@
 Project Management Agent - Specialized for executing project modifications and task reassignments
 """
 
-import json
-import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-from uuid import UUID, uuid4
-
-from agents import Agent, function_tool
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from agents import Agent, Runner, function_tool
+from cachetools import TTLCache
 from pydantic import BaseModel
 
 from ...events.bus import AgentType, BusinessEvent, BusinessEventType, event_bus
 from ...models.project import (
+    DatabaseResponse,
     ProjectDetailsResponse,
     ProjectResponse,
     ProjectStatus,
-    ProjectTask,
     ProjectTeam,
-    ProjectUpdateRequest,
     TaskResponse,
     TaskStatus,
 )
 from ...services.projectService import ProjectService
 from ...services.projectTaskService import ProjectTaskService
+from ...utils.db_errors import db_error, retry_transient, run_query
+from ...utils.formatting import format_staffer_name
 from ...utils.supabase_client import supabase_client
+from ._lookup_cache import (
+    get_staffer_name,
+    get_task_name,
+    remember_staffer_name,
+    remember_task_name,
+)
+from .resource_management import invalidate_assignments_cache
 
 # Streamlined Project Management System Prompt
 PROJECT_MANAGEMENT_PROMPT = """
@@ -38,11 +47,17 @@ Your primary responsibilities for the time-off reassignment flow:
 5. **Retrieve project and task details** to understand current state before making changes
 
 Key Capabilities:
-- Create new task assignments in the database
+- Create new task assignments in the database (use create_new_task_assignments to create several in one call)
+- Remove task assignments (use remove_task_assignments to remove several in one call)
 - Update task details including dates, status, and assignments
 - Update project status and due dates
 - Retrieve project and task information for context
 
+To move a single task from one staffer to another, use reassign_task: it removes
+the old assignment, creates the new one and updates the task dates in one call.
+When executing several reassignments, work out all of them first, then make one
+remove_task_assignments call and one create_new_task_assignments call.
+
 You DO NOT make assignment decisions - you EXECUTE the assignments and project updates that have been decided by other agents.
 
 Focus on providing clear confirmations of changes made and any impacts to project timelines.
@@ -51,6 +66,72 @@ When working with database operations, confirm success and provide structured fe
 """
 
 
+logger = logging.getLogger(__name__)
+
+
+# Cache of agent responses keyed by a digest of (query, project_context), so
+# retried or re-rendered requests don't pay for another full agent run
+_response_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+def _response_cache_key(query: str, project_context: Optional[str]) -> str:
+    payload = f"{query}|{project_context or ''}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Tools that modify the database. A run that called any of these is not
+# cached, since replaying its response would skip the write
+_WRITE_TOOLS = frozenset(
+    {
+        "create_new_task_assignment",
+        "create_new_task_assignments",
+        "remove_task_assignment",
+        "remove_task_assignments",
+        "reassign_task",
+        "update_task_details",
+        "update_task_status",
+        "update_project_status_tool",
+        "update_project_due_date_tool",
+    }
+)
+
+
+def _invalidate_caches() -> None:
+    """Drop cached assignment rows and agent responses; call after any write."""
+    invalidate_assignments_cache()
+    _response_cache.clear()
+
+
+def _is_read_only_run(result) -> bool:
+    """Check whether an agent run only called read-only tools."""
+    for item in result.new_items:
+        if item.type == "tool_call_item":
+            if getattr(item.raw_item, "name", None) in _WRITE_TOOLS:
+                return False
+    return True
+
+
+# Cap on the project context passed to the agent. Long inputs slow every model
+# call in the run, so callers should pass only the details the action needs
+MAX_PROJECT_CONTEXT_CHARS = 4000
+
+# Status lookups for the status tools, built once instead of on every call
+_TASK_STATUS_MAP = {status.value: status for status in TaskStatus}
+_TASK_STATUS_VALUES = ", ".join(_TASK_STATUS_MAP)
+_PROJECT_STATUS_MAP = {status.value: status for status in ProjectStatus}
+_PROJECT_STATUS_VALUES = ", ".join(_PROJECT_STATUS_MAP)
+
+# Maximum rows per bulk insert/delete request
+ASSIGNMENT_BATCH_SIZE = 500
+
+
+class TaskAssignmentPair(BaseModel):
+    """Staffer/task pair for bulk assignment tools"""
+
+    staffer_id: str
+    task_id: str
+
+
 @function_tool
 async def create_new_task_assignment(new_staffer_id: str, task_id: str) -> bool:
     """
@@ -65,50 +146,40 @@ async def create_new_task_assignment(new_staffer_id: str, task_id: str) -> bool:
     """
     try:
         if not supabase_client:
-            print("Did not find supabase client")
+            logger.warning("Did not find supabase client")
             return False
 
-        # Get task and staffer details for human-readable event
-        task_result = (
-            supabase_client.table("project_tasks")
-            .select("project_task_name")
-            .eq("project_task_id", task_id)
-            .execute()
-        )
-        staffer_result = (
-            supabase_client.table("staffers")
-            .select("first_name, last_name")
-            .eq("id", new_staffer_id)
-            .execute()
+        # Validates the staffer and task, inserts the assignment and returns
+        # the names for the event message in one round trip
+        result = await asyncio.to_thread(
+            supabase_client.rpc(
+                "create_staffer_assignment",
+                {"p_staffer_id": new_staffer_id, "p_project_task_id": task_id},
+            ).execute
         )
 
-        task_name = task_id
-        staffer_name = new_staffer_id
-        if task_result.data and len(task_result.data) > 0:
-            task_name = task_result.data[0]["project_task_name"]
-        if staffer_result.data and len(staffer_result.data) > 0:
-            staffer = staffer_result.data[0]
-            staffer_name = f"{staffer['first_name']} {staffer['last_name']}"
-
-        assignment_data = {
-            "staffer_id": new_staffer_id,
-            "project_task_id": task_id,
-            "created_at": datetime.utcnow().isoformat(),
-            "last_updated_at": datetime.utcnow().isoformat(),
-        }
+        if result.data:
+            assignment = result.data[0]
+            staffer_name = format_staffer_name(
+                assignment["staffer_first_name"],
+                assignment["staffer_last_name"],
+                new_staffer_id,
+            )
+            # Later removals of this assignment can reuse the names
+            await remember_staffer_name(new_staffer_id, staffer_name)
+            await remember_task_name(task_id, assignment["project_task_name"])
 
-        result = (
-            supabase_client.table("staffer_assignments")
-            .insert(assignment_data)
-            .execute()
-        )
+            if not assignment["created"]:
+                # Already assigned; the unique index made the insert a no-op
+                return True
+
+            _invalidate_caches()
 
-        if result.data:
             # Emit event for successful task assignment
             await event_bus.emit(
                 BusinessEvent(
                     type=BusinessEventType.UPDATE,
-                    message=f"Task '{task_name}' assigned to {staffer_name}",
+                    message=f"Task '{assignment['project_task_name']}' assigned to {staffer_name}",
                     agent_id=AgentType.PROJECT,
                 )
             )
@@ -117,10 +188,155 @@ async def create_new_task_assignment(new_staffer_id: str, task_id: str) -> bool:
         return False
 
     except Exception as e:
-        print(f"Error creating new task assignment: {e}")
+        logger.exception("Error creating new task assignment: %s", e)
         return False
 
 
+@function_tool
+async def create_new_task_assignments(
+    assignments: List[TaskAssignmentPair],
+) -> DatabaseResponse:
+    """
+    Create several task assignments at once. Prefer this over repeated
+    create_new_task_assignment calls when assigning more than one task.
+
+    Args:
+        assignments: List of staffer_id/task_id pairs to assign
+
+    Returns:
+        DatabaseResponse summarizing created and skipped assignments
+    """
+    try:
+        if not supabase_client:
+            return DatabaseResponse(
+                success=False, error="Database connection not available"
+            )
+        if not assignments:
+            return DatabaseResponse(success=False, error="No assignments provided")
+
+        staffer_ids = list({a.staffer_id for a in assignments})
+        task_ids = list({a.task_id for a in assignments})
+
+        # Validate every staffer and task with one query each instead of
+        # per-pair lookups
+        staffers_result, tasks_result = await asyncio.gather(
+            run_query(
+                supabase_client.table("staffers")
+                .select("id, first_name, last_name")
+                .in_("id", staffer_ids)
+                .execute
+            ),
+            run_query(
+                supabase_client.table("project_tasks")
+                .select("project_task_id, project_task_name")
+                .in_("project_task_id", task_ids)
+                .execute
+            ),
+        )
+
+        staffer_names = {
+            row["id"]: format_staffer_name(
+                row["first_name"], row["last_name"], row["id"]
+            )
+            for row in (staffers_result.data or [])
+        }
+        task_names = {
+            row["project_task_id"]: row["project_task_name"]
+            for row in (tasks_result.data or [])
+        }
+
+        valid_pairs = set()
+        skipped = []
+        for assignment in assignments:
+            if assignment.staffer_id not in staffer_names:
+                skipped.append(f"staffer {assignment.staffer_id} not found")
+            elif assignment.task_id not in task_names:
+                skipped.append(f"task {assignment.task_id} not found")
+            else:
+                valid_pairs.add((assignment.staffer_id, assignment.task_id))
+
+        new_pairs = []
+        already_assigned = 0
+        failed = 0
+        errors = []
+        if valid_pairs:
+            # The unique (staffer_id, project_task_id) index turns existing
+            # assignments into no-ops; only newly inserted rows come back
+            rows = [
+                {"staffer_id": staffer_id, "project_task_id": task_id}
+                for staffer_id, task_id in valid_pairs
+            ]
+            chunks = [
+                rows[i : i + ASSIGNMENT_BATCH_SIZE]
+                for i in range(0, len(rows), ASSIGNMENT_BATCH_SIZE)
+            ]
+            # Chunks commit independently, so one failing must not hide the
+            # ones that were saved
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        supabase_client.table("staffer_assignments")
+                        .upsert(
+                            chunk,
+                            on_conflict="staffer_id,project_task_id",
+                            ignore_duplicates=True,
+                        )
+                        .execute
+                    )
+                    for chunk in chunks
+                ),
+                return_exceptions=True,
+            )
+            saved = 0
+            for chunk, result in zip(chunks, results):
+                if isinstance(result, Exception):
+                    failed += len(chunk)
+                    errors.append(result)
+                    continue
+                saved += len(chunk)
+                new_pairs.extend(
+                    (row["staffer_id"], row["project_task_id"])
+                    for row in (result.data or [])
+                )
+            if errors and not saved:
+                raise errors[0]
+            already_assigned = saved - len(new_pairs)
+
+        if new_pairs:
+            _invalidate_caches()
+
+            await event_bus.emit_batch(
+                [
+                    BusinessEvent(
+                        type=BusinessEventType.UPDATE,
+                        message=f"Task '{task_names[task_id]}' assigned to {staffer_names[staffer_id]}",
+                        agent_id=AgentType.PROJECT,
+                    )
+                    for staffer_id, task_id in new_pairs
+                ]
+            )
+
+        message = f"Created {len(new_pairs)} task assignments"
+        if already_assigned:
+            message += f"; {already_assigned} were already assigned"
+        if skipped:
+            message += f"; skipped {len(skipped)}: {'; '.join(skipped)}"
+        if failed:
+            message += f"; {failed} could not be saved"
+
+        # Pairs that were already assigned are a no-op, not a failure, matching
+        # create_new_task_assignment. A partial save still succeeded, with the
+        # failed part reported in error
+        return DatabaseResponse(
+            success=bool(valid_pairs),
+            message=message,
+            error=db_error(errors[0])["error"] if errors else None,
+        )
+
+    except Exception as e:
+        return DatabaseResponse(**db_error(e))
+
+
 @function_tool
 async def remove_task_assignment(staffer_id: str, task_id: str) -> bool:
     """
@@ -135,38 +351,32 @@ async def remove_task_assignment(staffer_id: str, task_id: str) -> bool:
     """
     try:
         if not supabase_client:
-            print("Did not find supabase client")
+            logger.warning("Did not find supabase client")
             return False
 
-        # Get task and staffer details for human-readable event
-        task_result = (
-            supabase_client.table("project_tasks")
-            .select("project_task_name")
-            .eq("project_task_id", task_id)
-            .execute()
-        )
-        staffer_result = (
-            supabase_client.table("staffers")
-            .select("first_name, last_name")
-            .eq("id", staffer_id)
-            .execute()
+        # The names for the human-readable event don't depend on the delete, so
+        # fetch them (usually from cache) while the delete runs. Only a failed
+        # delete fails the tool; a failed name lookup falls back to the id
+        task_name, staffer_name, deleted = await asyncio.gather(
+            get_task_name(task_id),
+            get_staffer_name(staffer_id),
+            asyncio.to_thread(
+                supabase_client.table("staffer_assignments")
+                .delete()
+                .eq("staffer_id", staffer_id)
+                .eq("project_task_id", task_id)
+                .execute
+            ),
+            return_exceptions=True,
         )
+        if isinstance(deleted, Exception):
+            raise deleted
+        _invalidate_caches()
 
-        task_name = task_id
-        staffer_name = staffer_id
-        if task_result.data and len(task_result.data) > 0:
-            task_name = task_result.data[0]["project_task_name"]
-        if staffer_result.data and len(staffer_result.data) > 0:
-            staffer = staffer_result.data[0]
-            staffer_name = f"{staffer['first_name']} {staffer['last_name']}"
-
-        result = (
-            supabase_client.table("staffer_assignments")
-            .delete()
-            .eq("staffer_id", staffer_id)
-            .eq("project_task_id", task_id)
-            .execute()
-        )
+        if isinstance(task_name, Exception):
+            task_name = task_id
+        if isinstance(staffer_name, Exception):
+            staffer_name = staffer_id
 
         # Emit event for successful task assignment removal
         await event_bus.emit(
@@ -179,56 +389,312 @@ async def remove_task_assignment(staffer_id: str, task_id: str) -> bool:
         return True
 
     except Exception as e:
-        print(f"Error removing task assignment: {e}")
+        logger.exception("Error removing task assignment: %s", e)
         return False
 
 
 @function_tool
-def get_project_details(project_id: str) -> ProjectDetailsResponse:
+async def remove_task_assignments(
+    assignments: List[TaskAssignmentPair],
+) -> DatabaseResponse:
+    """
+    Remove several task assignments at once. Prefer this over repeated
+    remove_task_assignment calls when unassigning more than one task.
+
+    Args:
+        assignments: List of staffer_id/task_id pairs to unassign
+
+    Returns:
+        DatabaseResponse summarizing removed assignments
+    """
+    try:
+        if not supabase_client:
+            return DatabaseResponse(
+                success=False, error="Database connection not available"
+            )
+        if not assignments:
+            return DatabaseResponse(success=False, error="No assignments provided")
+
+        # One delete per staffer (and per ASSIGNMENT_BATCH_SIZE tasks) instead of
+        # one per pair
+        task_ids_by_staffer: Dict[str, List[str]] = {}
+        for assignment in assignments:
+            task_ids = task_ids_by_staffer.setdefault(assignment.staffer_id, [])
+            if assignment.task_id not in task_ids:
+                task_ids.append(assignment.task_id)
+
+        chunks = [
+            (staffer_id, task_ids[i : i + ASSIGNMENT_BATCH_SIZE])
+            for staffer_id, task_ids in task_ids_by_staffer.items()
+            for i in range(0, len(task_ids), ASSIGNMENT_BATCH_SIZE)
+        ]
+        deletes = [
+            asyncio.to_thread(
+                supabase_client.table("staffer_assignments")
+                .delete()
+                .eq("staffer_id", staffer_id)
+                .in_("project_task_id", chunk)
+                .execute
+            )
+            for staffer_id, chunk in chunks
+        ]
+
+        # Names for the event messages are fetched alongside the deletes. The
+        # deletes commit independently, so failures are collected rather than
+        # raised: a failed lookup falls back to ids, a failed delete is reported
+        staffers_result, tasks_result, *results = await asyncio.gather(
+            run_query(
+                supabase_client.table("staffers")
+                .select("id, first_name, last_name")
+                .in_("id", list(task_ids_by_staffer))
+                .execute
+            ),
+            run_query(
+                supabase_client.table("project_tasks")
+                .select("project_task_id, project_task_name")
+                .in_("project_task_id", list({a.task_id for a in assignments}))
+                .execute
+            ),
+            *deletes,
+            return_exceptions=True,
+        )
+
+        removed = []
+        failed = 0
+        errors = []
+        for (_, chunk), result in zip(chunks, results):
+            if isinstance(result, Exception):
+                failed += len(chunk)
+                errors.append(result)
+                continue
+            removed.extend(
+                (row["staffer_id"], row["project_task_id"])
+                for row in (result.data or [])
+            )
+        if removed:
+            _invalidate_caches()
+        if errors and len(errors) == len(chunks):
+            raise errors[0]
+
+        staffer_names = {}
+        if not isinstance(staffers_result, Exception):
+            staffer_names = {
+                row["id"]: format_staffer_name(
+                    row["first_name"], row["last_name"], row["id"]
+                )
+                for row in (staffers_result.data or [])
+            }
+        task_names = {}
+        if not isinstance(tasks_result, Exception):
+            task_names = {
+                row["project_task_id"]: row["project_task_name"]
+                for row in (tasks_result.data or [])
+            }
+        await event_bus.emit_batch(
+            [
+                BusinessEvent(
+                    type=BusinessEventType.UPDATE,
+                    message=f"Task '{task_names.get(task_id, task_id)}' unassigned from {staffer_names.get(staffer_id, staffer_id)}",
+                    agent_id=AgentType.PROJECT,
+                )
+                for staffer_id, task_id in removed
+            ]
+        )
+
+        message = f"Removed {len(removed)} task assignments"
+        requested = sum(len(task_ids) for task_ids in task_ids_by_staffer.values())
+        not_found = requested - failed - len(removed)
+        if not_found > 0:
+            message += f"; {not_found} were not assigned"
+        if failed:
+            message += f"; {failed} could not be removed"
+
+        return DatabaseResponse(
+            success=bool(removed),
+            message=message,
+            error=db_error(errors[0])["error"] if errors else None,
+        )
+
+    except Exception as e:
+        return DatabaseResponse(**db_error(e))
+
+
+@function_tool
+async def reassign_task(
+    old_staffer_id: str,
+    new_staffer_id: str,
+    task_id: str,
+    new_start_date: Optional[str] = None,
+    new_due_date: Optional[str] = None,
+) -> DatabaseResponse:
+    """
+    Move a task from one staffer to another, optionally updating its dates.
+    Prefer this over separate remove, create and update calls for a single
+    reassignment.
+
+    Args:
+        old_staffer_id: ID of the staffer currently assigned
+        new_staffer_id: ID of the replacement staffer
+        task_id: ID of the task to reassign
+        new_start_date: New start date in YYYY-MM-DD format (optional)
+        new_due_date: New due date in YYYY-MM-DD format (optional)
+
+    Returns:
+        DatabaseResponse describing the reassignment
+    """
+    try:
+        if not supabase_client:
+            return DatabaseResponse(
+                success=False, error="Database connection not available"
+            )
+
+        if old_staffer_id == new_staffer_id:
+            return DatabaseResponse(
+                success=False,
+                error="Old and new staffer are the same; use update_task_details to change the task dates",
+            )
+
+        date_updates = {}
+        if new_start_date is not None:
+            date_updates["project_task_start_date"] = new_start_date
+        if new_due_date is not None:
+            date_updates["project_task_due_date"] = new_due_date
+
+        # The insert of the new assignment and the delete of the old one happen
+        # in one transaction, so a failed insert never leaves the task unassigned
+        result = await asyncio.to_thread(
+            supabase_client.rpc(
+                "reassign_staffer_assignment",
+                {
+                    "p_project_task_id": task_id,
+                    "p_old_staffer_id": old_staffer_id,
+                    "p_new_staffer_id": new_staffer_id,
+                },
+            ).execute
+        )
+        _invalidate_caches()
+
+        if not result.data:
+            return DatabaseResponse(
+                success=False,
+                error=f"Could not reassign task {task_id} to staffer {new_staffer_id}",
+            )
+
+        swap = result.data[0]
+        task_name = swap["project_task_name"]
+        old_staffer_name = format_staffer_name(
+            swap["old_staffer_first_name"],
+            swap["old_staffer_last_name"],
+            old_staffer_id,
+        )
+        new_staffer_name = format_staffer_name(
+            swap["new_staffer_first_name"],
+            swap["new_staffer_last_name"],
+            new_staffer_id,
+        )
+        await remember_staffer_name(new_staffer_id, new_staffer_name)
+        await remember_task_name(task_id, task_name)
+
+        # Dates only change once the assignment has actually moved
+        update = None
+        if date_updates:
+            update = await retry_transient(
+                ProjectTaskService.update_task, task_id, date_updates
+            )
+
+        message = f"Task '{task_name}' reassigned from {old_staffer_name} to {new_staffer_name}"
+        if update is not None and update.success:
+            message += f" with new dates: {', '.join(date_updates.values())}"
+        if not swap["removed"]:
+            message += f" ({old_staffer_name} was not assigned to it)"
+
+        await event_bus.emit(
+            BusinessEvent(
+                type=BusinessEventType.UPDATE,
+                message=message,
+                agent_id=AgentType.PROJECT,
+            )
+        )
+
+        if update is not None and not update.success:
+            return DatabaseResponse(
+                success=False,
+                message=message,
+                error=f"Date update failed: {update.error}",
+            )
+        return DatabaseResponse(success=True, message=message)
+
+    except Exception as e:
+        return DatabaseResponse(**db_error(e))
+
+
+@function_tool
+async def get_project_details(
+    project_id: str, task_limit: int = 100, task_offset: int = 0
+) -> ProjectDetailsResponse:
     """
     Retrieve detailed project information with structured models using ProjectService.
+    Tasks are paginated: if the number of tasks returned equals task_limit, call again
+    with task_offset increased by task_limit to get the next page.
 
     Args:
         project_id: UUID of the project
+        task_limit: Maximum number of tasks to return (default 100)
+        task_offset: Number of tasks to skip, for fetching later pages (default 0)
 
     Returns:
-        ProjectDetailsResponse with complete structured project details
+        ProjectDetailsResponse with structured project details and one page of tasks
     """
     try:
         if not supabase_client:
             return ProjectDetailsResponse(
                 success=False, error="Database connection not available"
             )
+        if task_limit <= 0 or task_offset < 0:
+            return ProjectDetailsResponse(
+                success=False,
+                error="task_limit must be positive and task_offset must not be negative",
+            )
 
-        # Get project using ProjectService
-        project_response = ProjectService.get_project_by_id(project_id)
+        # The project, its tasks and its teams are independent reads, so fetch
+        # them concurrently
+        project_response, tasks, teams_result = await asyncio.gather(
+            asyncio.to_thread(ProjectService.get_project_by_id, project_id),
+            asyncio.to_thread(
+                ProjectTaskService.get_tasks_by_project,
+                project_id,
+                limit=task_limit,
+                offset=task_offset,
+            ),
+            run_query(
+                supabase_client.table("project_teams")
+                .select("*")
+                .eq("project_id", project_id)
+                .execute
+            ),
+        )
 
         if not project_response.success:
             return ProjectDetailsResponse(success=False, error=project_response.error)
 
         project = project_response.project
-        # Get project tasks using ProjectTaskService
-        tasks = ProjectTaskService.get_tasks_by_project(project_id)
-
-        # Get project teams
-        teams_result = (
-            supabase_client.table("project_teams")
-            .select("*")
-            .eq("project_id", project_id)
-            .execute()
-        )
         teams = [ProjectTeam(**team) for team in (teams_result.data or [])]
 
-        return ProjectDetailsResponse(
-            success=True, project=project, phases=None, tasks=tasks, teams=teams
+        # project, tasks and teams are already validated models
+        return ProjectDetailsResponse.model_construct(
+            success=True,
+            project=project,
+            tasks=tasks,
+            teams=teams,
+            message=f"Returned {len(tasks)} tasks starting at offset {task_offset}",
         )
 
     except Exception as e:
-        return ProjectDetailsResponse(success=False, error=f"Database error: {str(e)}")
+        return ProjectDetailsResponse(**db_error(e))
 
 
 @function_tool
-def get_task_by_id(task_id: str) -> TaskResponse:
+async def get_task_by_id(task_id: str) -> TaskResponse:
     """
     Retrieve a specific project task by its ID using the task service.
 
@@ -238,7 +704,7 @@ def get_task_by_id(task_id: str) -> TaskResponse:
     Returns:
         TaskResponse with task data or error
     """
-    return ProjectTaskService.get_task_by_id(task_id)
+    return await asyncio.to_thread(ProjectTaskService.get_task_by_id, task_id)
 
 
 @function_tool
@@ -262,6 +728,10 @@ async def update_task_details(
     Returns:
         TaskResponse with updated task data or error
     """
+    # Answer an empty call without touching the database
+    if task_name is task_description is task_start_date is task_due_date is None:
+        return TaskResponse(success=False, error="No update data provided")
+
     updates = {}
     if task_name is not None:
         updates["project_task_name"] = task_name
@@ -272,12 +742,11 @@ async def update_task_details(
     if task_due_date is not None:
         updates["project_task_due_date"] = task_due_date
 
-    if not updates:
-        return TaskResponse(success=False, error="No update data provided")
-
-    response = ProjectTaskService.update_task(task_id, updates)
+    response = await retry_transient(ProjectTaskService.update_task, task_id, updates)
 
     if response.success:
+        _invalidate_caches()
+
         # Emit event for successful task details update
         await event_bus.emit(
             BusinessEvent(
@@ -302,12 +771,21 @@ async def update_task_status(task_id: str, new_status: str) -> TaskResponse:
     Returns:
         TaskResponse with updated task data or error
     """
+    status_enum = _TASK_STATUS_MAP.get(new_status.lower())
+    if status_enum is None:
+        return TaskResponse(
+            success=False,
+            error=f"Invalid status: {new_status}. Valid options are: {_TASK_STATUS_VALUES}",
+        )
+
     try:
-        # Convert string to TaskStatus enum
-        status_enum = TaskStatus(new_status.lower())
-        response = ProjectTaskService.update_task_status(task_id, status_enum)
+        response = await retry_transient(
+            ProjectTaskService.update_task_status, task_id, status_enum
+        )
 
         if response.success:
+            _invalidate_caches()
+
             # Emit event for successful task status update
             await event_bus.emit(
                 BusinessEvent(
@@ -318,11 +796,6 @@ async def update_task_status(task_id: str, new_status: str) -> TaskResponse:
             )
 
         return response
-    except ValueError:
-        return TaskResponse(
-            success=False,
-            error=f"Invalid status: {new_status}. Valid options are: {[s.value for s in TaskStatus]}",
-        )
     except Exception as e:
         return TaskResponse(
             success=False, error=f"Error updating task status: {str(e)}"
@@ -343,12 +816,21 @@ async def update_project_status_tool(
     Returns:
         ProjectResponse with updated project data or error
     """
+    status_enum = _PROJECT_STATUS_MAP.get(new_status.lower())
+    if status_enum is None:
+        return ProjectResponse(
+            success=False,
+            error=f"Invalid status: {new_status}. Valid options are: {_PROJECT_STATUS_VALUES}",
+        )
+
     try:
-        # Convert string to ProjectStatus enum
-        status_enum = ProjectStatus(new_status.lower())
-        response = ProjectService.update_project_status(project_id, status_enum)
+        response = await retry_transient(
+            ProjectService.update_project_status, project_id, status_enum
+        )
 
         if response.success:
+            _invalidate_caches()
+
             # Emit event for successful project status update
             await event_bus.emit(
                 BusinessEvent(
@@ -359,11 +841,6 @@ async def update_project_status_tool(
             )
 
         return response
-    except ValueError:
-        return ProjectResponse(
-            success=False,
-            error=f"Invalid status: {new_status}. Valid options are: {[s.value for s in ProjectStatus]}",
-        )
     except Exception as e:
         return ProjectResponse(
             success=False, error=f"Error updating project status: {str(e)}"
@@ -391,8 +868,6 @@ async def update_project_due_date_tool(
 
         # Basic date format validation if due_date is provided
         if due_date:
-            from datetime import datetime
-
             try:
                 datetime.strptime(due_date, "%Y-%m-%d")
             except ValueError:
@@ -401,9 +876,13 @@ async def update_project_due_date_tool(
                     error=f"Invalid date format: {due_date}. Please use YYYY-MM-DD format.",
                 )
 
-        response = ProjectService.update_project_due_date(project_id, due_date)
+        response = await retry_transient(
+            ProjectService.update_project_due_date, project_id, due_date
+        )
 
         if response.success:
+            _invalidate_caches()
+
             # Emit event for successful project due date update
             await event_bus.emit(
                 BusinessEvent(
@@ -428,7 +907,10 @@ project_management_agent = Agent(
     tools=[
         # Core functions needed for time-off reassignment flow
         create_new_task_assignment,
+        create_new_task_assignments,
         remove_task_assignment,
+        remove_task_assignments,
+        reassign_task,
         get_project_details,
         get_task_by_id,
         update_task_details,
@@ -440,33 +922,46 @@ project_management_agent = Agent(
 
 
 async def handle_project_management(
-    query: str, project_context: Optional[str] = None
+    query: str, project_context: Optional[str] = None, no_cache: bool = False
 ) -> str:
     """
     Handle project management queries focused on executing modifications and reassignments.
 
     Args:
         query: Project management action request
-        project_context: Optional context about existing project details
+        project_context: Optional context about existing project details. Only
+            the last MAX_PROJECT_CONTEXT_CHARS characters are sent to the agent
+        no_cache: If True, always run the agent instead of returning a cached
+            response for an identical (query, project_context) pair
 
     Returns:
         Structured project management response confirming actions taken
     """
+    cache_key = _response_cache_key(query, project_context)
+    if not no_cache:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         # Enhance query with context if provided
         enhanced_query = query
         if project_context:
+            project_context = project_context[-MAX_PROJECT_CONTEXT_CHARS:]
             enhanced_query = (
                 f"Project Context: {project_context}\n\nAction Request: {query}"
             )
 
         # Run the agent with the OpenAI Agents SDK
-        from agents import Runner
-
-        result = await Runner.run(agent=project_management_agent, input=enhanced_query)
+        result = await Runner.run(
+            starting_agent=project_management_agent, input=enhanced_query
+        )
 
         # Structure the response for consistency
-        return f"Project Management Actions Executed:\n{str(result)}"
+        response = f"Project Management Actions Executed:\n{str(result)}"
+        if _is_read_only_run(result):
+            _response_cache[cache_key] = response
+        return response
 
     except Exception as e:
         return f"Error in project management agent: {str(e)}"
@@ -1,12 +1,19 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from uuid import UUID
-
-from agents import Agent, function_tool
+import asyncio
+import logging
+import os
+import threading
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from agents import Agent, Runner, function_tool
+from cachetools import TTLCache
+from openai.types.responses import ResponseTextDeltaEvent
 from pydantic import BaseModel, Field
 
 from ...events.bus import AgentType, BusinessEvent, BusinessEventType, event_bus
-from ...utils.supabase_client import supabase_client
+from ...utils.db_errors import run_query
+from ...utils.formatting import format_staffer_name
+from ...utils.supabase_client import execute_fast, supabase_client
 
 
 # Pydantic Models for Structured Input/Output
@@ -80,9 +87,78 @@ class ResourceManagementResponse(BaseModel):
     recommendations: List[str] = Field(default_factory=list)
 
 
-# Database Tools
-@function_tool
-def find_staffer_by_name(staffer_name: str) -> Optional[StafferInfo]:
+class ReassignmentContext(BaseModel):
+    """Lookups for a time-off request, fetched before any agent involvement"""
+
+    staffer_id: str
+    staffer_name: str
+    start_datetime: str
+    end_datetime: str
+    affected_tasks: List[TaskAssignment]
+    candidates: List[StafferInfo]
+    # Candidate staffer_id -> ids of the affected projects whose team they're on
+    candidate_project_ids: Dict[str, List[str]]
+
+
+logger = logging.getLogger(__name__)
+
+
+# Short-lived cache of overlapping assignment rows per (staffer_id, start, end),
+# so repeated tool calls within an agent run don't re-query Supabase
+_assignments_cache: TTLCache = TTLCache(maxsize=256, ttl=15)
+_assignments_cache_lock = threading.Lock()
+
+
+def invalidate_assignments_cache() -> None:
+    """Drop cached assignment rows; call after any staffer_assignments write."""
+    with _assignments_cache_lock:
+        _assignments_cache.clear()
+
+
+def _coerce_date(value: Any) -> Optional[date]:
+    """
+    Convert an ISO date/datetime string, datetime or date to a date.
+
+    Strings are parsed from their leading YYYY-MM-DD only, which gives the same
+    date as a full datetime parse without building tzinfo objects.
+    Returns None for missing values; raises ValueError for malformed strings.
+    """
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+# Staffer lookups by whitespace-normalized name. Staffer rows rarely change,
+# and the agent resolves the same names repeatedly. Misses are cached as
+# _STAFFER_NOT_FOUND for a shorter time, since staffers are created from the
+# frontend and a new one should become findable quickly
+_staffer_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_staffer_miss_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+_staffer_cache_lock = threading.Lock()
+_STAFFER_NOT_FOUND = object()
+
+
+def invalidate_staffer_cache() -> None:
+    """Drop cached staffer lookups; call after any staffers write."""
+    with _staffer_cache_lock:
+        _staffer_cache.clear()
+        _staffer_miss_cache.clear()
+
+
+# Staffer columns with the seniority embedded, so a lookup is one request
+_STAFFER_LOOKUP_COLUMNS = (
+    "id, first_name, last_name, title, capacity, time_zone, "
+    "seniorities(seniority_level)"
+)
+
+
+# Database Tools. These are plain functions so the deterministic fast path can
+# call them directly; the agent gets function_tool wrappers of the same functions
+async def find_staffer_by_name(staffer_name: str) -> Optional[StafferInfo]:
     """
     Find a staffer by their full name in the database.
 
@@ -92,9 +168,16 @@ def find_staffer_by_name(staffer_name: str) -> Optional[StafferInfo]:
     Returns:
         StafferInfo object if found, None otherwise
     """
+    # Case is kept in the key because the first/last name match is case-sensitive
+    cache_key = " ".join(staffer_name.split())
+    with _staffer_cache_lock:
+        cached = _staffer_cache.get(cache_key) or _staffer_miss_cache.get(cache_key)
+    if cached is not None:
+        return None if cached is _STAFFER_NOT_FOUND else cached
+
     try:
         if not supabase_client:
-            print("Did not find supabase client")
+            logger.warning("Did not find supabase client")
             return None
 
         # Try to parse first and last name
@@ -103,44 +186,33 @@ def find_staffer_by_name(staffer_name: str) -> Optional[StafferInfo]:
             first_name = name_parts[0]
             last_name = " ".join(name_parts[1:])
 
-            result = (
+            result = await run_query(
                 supabase_client.table("staffers")
-                .select(
-                    "id, first_name, last_name, title, capacity, time_zone, seniority_id"
-                )
+                .select(_STAFFER_LOOKUP_COLUMNS)
                 .eq("first_name", first_name)
                 .eq("last_name", last_name)
-                .execute()
+                .limit(1)
+                .execute
             )
         else:
-            # Fallback: search in both first and last name fields
-            result = (
-                supabase_client.table("staffers")
-                .select(
-                    "id, first_name, last_name, title, capacity, time_zone, seniority_id"
-                )
-                .or_(
-                    f"first_name.ilike.%{staffer_name}%,last_name.ilike.%{staffer_name}%"
-                )
-                .execute()
+            # Fallback: trigram-indexed fuzzy match on the full name; rows come
+            # back best match first with seniority_level already flattened
+            result = await run_query(
+                supabase_client.rpc(
+                    "find_staffer_fuzzy", {"q": staffer_name.strip(), "max_results": 1}
+                ).execute
             )
 
         if result.data and len(result.data) > 0:
             staffer = result.data[0]
 
-            # Get seniority level if available
-            seniority_level = None
-            if staffer.get("seniority_id"):
-                seniority_result = (
-                    supabase_client.table("seniorities")
-                    .select("seniority_level")
-                    .eq("seniority_id", staffer["seniority_id"])
-                    .execute()
-                )
-                if seniority_result.data:
-                    seniority_level = seniority_result.data[0]["seniority_level"]
+            if "seniorities" in staffer:
+                seniority = staffer["seniorities"]
+                seniority_level = seniority["seniority_level"] if seniority else None
+            else:
+                seniority_level = staffer.get("seniority_level")
 
-            return StafferInfo(
+            staffer_info = StafferInfo(
                 staffer_id=staffer["id"],
                 first_name=staffer["first_name"],
                 last_name=staffer["last_name"],
@@ -149,196 +221,202 @@ def find_staffer_by_name(staffer_name: str) -> Optional[StafferInfo]:
                 time_zone=staffer.get("time_zone"),
                 seniority_level=seniority_level,
             )
+            with _staffer_cache_lock:
+                _staffer_cache[cache_key] = staffer_info
+            return staffer_info
+
+        with _staffer_cache_lock:
+            _staffer_miss_cache[cache_key] = _STAFFER_NOT_FOUND
 
     except Exception as e:
-        print(f"Error finding staffer by name: {e}")
+        logger.exception("Error finding staffer by name: %s", e)
 
     return None
 
 
-@function_tool
-async def get_staffer_task_assignments(
+async def _load_staffer_task_assignments(
     staffer_id: str, start_date: str, end_date: str
 ) -> List[TaskAssignment]:
     """
-    Get all task assignments for a staffer that overlap with the given time period.
-
-    Args:
-        staffer_id: UUID of the staffer
-        start_date: Start date to check (ISO format)
-        end_date: End date to check (ISO format)
-
-    Returns:
-        List of TaskAssignment objects that may be affected
+    Get a staffer's task assignments overlapping the given period, raising on
+    database errors so callers can tell a failed lookup from "no tasks".
     """
-    try:
-        if not supabase_client:
-            print("Did not find supabase client")
-            return []
+    if not supabase_client:
+        raise RuntimeError("Database connection not available")
 
-        # Get staffer info for human-readable event
-        staffer_result = (
+    try:
+        timeoff_start_dt = _coerce_date(start_date)
+        timeoff_end_dt = _coerce_date(end_date)
+    except ValueError as e:
+        # A null period makes the RPC return every assignment
+        logger.warning("Date parsing failed for time-off period: %s", e)
+        timeoff_start_dt = timeoff_end_dt = None
+
+    cache_key = (staffer_id, timeoff_start_dt, timeoff_end_dt)
+    with _assignments_cache_lock:
+        rows = _assignments_cache.get(cache_key)
+
+    if rows is None:
+        # Overlap is filtered in Postgres, so only affected assignments
+        # (with task, project and staffer columns) come back
+        rows = await run_query(
+            execute_fast,
+            supabase_client.rpc(
+                "staffer_tasks_overlapping",
+                {
+                    "p_staffer_id": staffer_id,
+                    "p_start": (
+                        timeoff_start_dt.isoformat() if timeoff_start_dt else None
+                    ),
+                    "p_end": timeoff_end_dt.isoformat() if timeoff_end_dt else None,
+                },
+            ),
+        )
+        with _assignments_cache_lock:
+            _assignments_cache[cache_key] = rows
+
+    # Staffer name comes from the returned rows; only look it up separately
+    # when no assignment overlaps
+    staffer_name = staffer_id
+    if rows:
+        staffer = rows[0]
+        staffer_name = format_staffer_name(
+            staffer["first_name"], staffer["last_name"], staffer_id
+        )
+    else:
+        staffer_result = await run_query(
             supabase_client.table("staffers")
             .select("first_name, last_name")
             .eq("id", staffer_id)
-            .execute()
+            .limit(1)
+            .execute
         )
-        staffer_name = staffer_id
         if staffer_result.data and len(staffer_result.data) > 0:
             staffer = staffer_result.data[0]
-            staffer_name = f"{staffer['first_name']} {staffer['last_name']}"
+            staffer_name = format_staffer_name(
+                staffer["first_name"], staffer["last_name"], staffer_id
+            )
 
-        # Emit event that we're checking assignments
-        await event_bus.emit(BusinessEvent(
+    # Events are collected and emitted in one batch at the end
+    events = [
+        BusinessEvent(
             type=BusinessEventType.UPDATE,
             message=f"Checking task assignments for {staffer_name} between {start_date} and {end_date}",
-            agent_id=AgentType.RESOURCE_MANAGEMENT
-        ))
-
-        # Get staffer assignments with task and project details
-        result = (
-            supabase_client.table("staffer_assignments")
-            .select(
-                """
-                project_task_id,
-                project_tasks!inner(
-                    project_task_id,
-                    project_task_name,
-                    project_id,
-                    estimated_hours,
-                    project_task_start_date,
-                    project_task_due_date,
-                    projects!inner(
-                        project_name
-                    )
-                )
-            """
+            agent_id=AgentType.RESOURCE_MANAGEMENT,
+        )
+    ]
+
+    assignments = []
+    for task in rows:
+        # Rows come straight from the database with the column
+        # types TaskAssignment declares, so skip re-validation
+        assignments.append(
+            TaskAssignment.model_construct(
+                task_id=task["project_task_id"],
+                task_name=task["project_task_name"],
+                project_id=task["project_id"],
+                project_name=task["project_name"],
+                estimated_hours=task["estimated_hours"],
+                task_start_date=task["project_task_start_date"],
+                task_due_date=task["project_task_due_date"],
+                current_staffer_id=staffer_id,
             )
-            .eq("staffer_id", staffer_id)
-            .execute()
         )
-
-        assignments = []
-        if result.data:
-            for assignment in result.data:
-                task = assignment["project_tasks"]
-                project = task["projects"]
-
-                # Check if task overlaps with time-off period
-                task_start = task.get("project_task_start_date")
-                task_due = task.get("project_task_due_date")
-
-                # If task has no dates, assume it might be affected
-                overlaps = True
-                if task_start and task_due:
-                    try:
-                        # Parse dates - database should now return proper date objects or ISO strings
-                        from datetime import date
-
-                        # Handle both date objects and string formats
-                        if isinstance(task_start, str):
-                            task_start_dt = datetime.fromisoformat(
-                                task_start.replace("Z", "+00:00")
-                            ).date()
-                        elif isinstance(task_start, date):
-                            task_start_dt = task_start
-                        else:
-                            task_start_dt = None
-
-                        if isinstance(task_due, str):
-                            task_due_dt = datetime.fromisoformat(
-                                task_due.replace("Z", "+00:00")
-                            ).date()
-                        elif isinstance(task_due, date):
-                            task_due_dt = task_due
-                        else:
-                            task_due_dt = None
-
-                        if isinstance(start_date, str):
-                            timeoff_start_dt = datetime.fromisoformat(
-                                start_date.replace("Z", "+00:00")
-                            ).date()
-                        elif isinstance(start_date, date):
-                            timeoff_start_dt = start_date
-                        else:
-                            timeoff_start_dt = None
-
-                        if isinstance(end_date, str):
-                            timeoff_end_dt = datetime.fromisoformat(
-                                end_date.replace("Z", "+00:00")
-                            ).date()
-                        elif isinstance(end_date, date):
-                            timeoff_end_dt = end_date
-                        else:
-                            timeoff_end_dt = None
-
-                        # Only check overlap if all dates were parsed successfully
-                        if all(
-                            [
-                                task_start_dt,
-                                task_due_dt,
-                                timeoff_start_dt,
-                                timeoff_end_dt,
-                            ]
-                        ):
-                            overlaps = not (
-                                task_due_dt < timeoff_start_dt
-                                or task_start_dt > timeoff_end_dt
-                            )
-                        # If any date parsing failed, assume overlap to be safe
-                    except Exception as e:
-                        print(
-                            f"Warning: Date parsing failed for task {task.get('project_task_id', 'unknown')}: {e}"
-                        )
-                        # Assume overlap when dates can't be parsed
-
-                if overlaps:
-                    assignments.append(
-                        TaskAssignment(
-                            task_id=task["project_task_id"],
-                            task_name=task["project_task_name"],
-                            project_id=task["project_id"],
-                            project_name=project["project_name"],
-                            estimated_hours=task.get("estimated_hours"),
-                            task_start_date=task.get("project_task_start_date"),
-                            task_due_date=task.get("project_task_due_date"),
-                            current_staffer_id=staffer_id,
-                        )
-                    )
-                    # Emit event for found overlap
-                    await event_bus.emit(BusinessEvent(
-                        type=BusinessEventType.UPDATE,
-                        message=f"Found overlap: Task '{task['project_task_name']}' in project '{project['project_name']}' needs attention",
-                        agent_id=AgentType.RESOURCE_MANAGEMENT
-                    ))
-
-        # Emit summary event
-        if assignments:
-            await event_bus.emit(BusinessEvent(
-                type=BusinessEventType.UPDATE,
-                message=f"Found {len(assignments)} tasks that need reassignment for {staffer_name}'s time off",
-                agent_id=AgentType.RESOURCE_MANAGEMENT
-            ))
-        else:
-            await event_bus.emit(BusinessEvent(
+        # Event for found overlap
+        events.append(
+            BusinessEvent(
                 type=BusinessEventType.UPDATE,
-                message=f"No task conflicts found for {staffer_name}'s time off period",
-                agent_id=AgentType.RESOURCE_MANAGEMENT
-            ))
+                message=f"Found overlap: Task '{task['project_task_name']}' in project '{task['project_name']}' needs attention",
+                agent_id=AgentType.RESOURCE_MANAGEMENT,
+            )
+        )
+
+    # Summary event
+    if assignments:
+        summary = f"Found {len(assignments)} tasks that need reassignment for {staffer_name}'s time off"
+    else:
+        summary = f"No task conflicts found for {staffer_name}'s time off period"
+    events.append(
+        BusinessEvent(
+            type=BusinessEventType.UPDATE,
+            message=summary,
+            agent_id=AgentType.RESOURCE_MANAGEMENT,
+        )
+    )
+    await event_bus.emit_batch(events)
+
+    return assignments
 
-        return assignments
 
+async def get_staffer_task_assignments(
+    staffer_id: str, start_date: str, end_date: str
+) -> List[TaskAssignment]:
+    """
+    Get all task assignments for a staffer that overlap with the given time period.
+
+    Args:
+        staffer_id: UUID of the staffer
+        start_date: Start date to check (ISO format)
+        end_date: End date to check (ISO format)
+
+    Returns:
+        List of TaskAssignment objects that may be affected
+    """
+    try:
+        return await _load_staffer_task_assignments(staffer_id, start_date, end_date)
     except Exception as e:
-        print(f"Error getting staffer task assignments: {e}")
+        logger.exception("Error getting staffer task assignments: %s", e)
         return []
 
 
-@function_tool
-def find_available_staffers(
+def _staffer_info(staffer: Dict[str, Any]) -> StafferInfo:
+    """Build a StafferInfo from a find_replacement_candidates row."""
+    return StafferInfo.model_construct(
+        staffer_id=staffer["id"],
+        first_name=staffer["first_name"],
+        last_name=staffer["last_name"],
+        title=staffer["title"],
+        capacity=staffer["capacity"],
+        time_zone=staffer.get("time_zone"),
+        seniority_level=staffer["seniority_level"],
+    )
+
+
+async def _fetch_available_staffer_rows(
+    exclude_staffer_id: str,
+    check_start_dt: date,
+    check_end_dt: date,
+    project_ids: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch staffers with capacity and no time off overlapping the period, best
+    matches first (seniority, then capacity). The filtering, team membership
+    check and ranking all happen in the find_replacement_candidates function.
+    Each row has team_project_ids, so callers can match staffers to projects
+    without another query.
+    """
+    return await run_query(
+        execute_fast,
+        supabase_client.rpc(
+            "find_replacement_candidates",
+            {
+                "p_exclude_staffer_id": exclude_staffer_id,
+                "p_start": check_start_dt.isoformat(),
+                "p_end": check_end_dt.isoformat(),
+                "p_project_ids": project_ids or None,
+                "max_results": limit,
+            },
+        ),
+    )
+
+
+async def find_available_staffers(
     exclude_staffer_id: str,
     start_date: str,
     end_date: str,
     project_ids: Optional[List[str]] = None,
+    limit: int = 50,
 ) -> List[StafferInfo]:
     """
     Find staffers who are available (no PTO conflicts) and on relevant project teams during the specified time period.
@@ -348,164 +426,38 @@ def find_available_staffers(
         start_date: Start date to check availability (ISO format)
         end_date: End date to check availability (ISO format)
         project_ids: Optional list of project IDs to filter team members (if provided, only return staffers on these project teams)
+        limit: Maximum number of staffers to return, best matches first
 
     Returns:
         List of available StafferInfo objects (no PTO conflicts and on project teams)
     """
     try:
         if not supabase_client:
-            print("Did not find supabase client")
-            return []
-
-        # Get all staffers (excluding the one taking time off)
-        staffers_result = (
-            supabase_client.table("staffers")
-            .select(
-                """
-                id,
-                first_name,
-                last_name,
-                title,
-                capacity,
-                time_zone,
-                seniority_id,
-                seniorities(seniority_level)
-            """
-            )
-            .neq("id", exclude_staffer_id)
-            .execute()
-        )
-
-        if not staffers_result.data:
+            logger.warning("Did not find supabase client")
             return []
 
         # Parse the time period for comparison
         try:
-            from datetime import date
-
-            if isinstance(start_date, str):
-                check_start_dt = datetime.fromisoformat(
-                    start_date.replace("Z", "+00:00")
-                ).date()
-            elif isinstance(start_date, date):
-                check_start_dt = start_date
-            else:
-                print(f"Warning: Invalid start_date format: {start_date}")
-                return []
-
-            if isinstance(end_date, str):
-                check_end_dt = datetime.fromisoformat(
-                    end_date.replace("Z", "+00:00")
-                ).date()
-            elif isinstance(end_date, date):
-                check_end_dt = end_date
-            else:
-                print(f"Warning: Invalid end_date format: {end_date}")
-                return []
-        except Exception as date_error:
-            print(f"Error parsing availability check dates: {date_error}")
+            check_start_dt = _coerce_date(start_date)
+            check_end_dt = _coerce_date(end_date)
+        except ValueError as date_error:
+            logger.warning("Error parsing availability check dates: %s", date_error)
+            return []
+        if not check_start_dt or not check_end_dt:
+            logger.warning("Invalid availability dates: %s to %s", start_date, end_date)
             return []
 
-        available_staffers = []
-
-        for staffer in staffers_result.data:
-            staffer_id = staffer["id"]
-
-            # Check if this staffer has any conflicting time off
-            time_off_result = (
-                supabase_client.table("staffer_time_off")
-                .select("time_off_start_datetime, time_off_end_datetime")
-                .eq("staffer_id", staffer_id)
-                .execute()
-            )
-
-            has_conflict = False
-            if time_off_result.data:
-                for time_off in time_off_result.data:
-                    try:
-                        pto_start = time_off.get("time_off_start_datetime")
-                        pto_end = time_off.get("time_off_end_datetime")
-
-                        if pto_start and pto_end:
-                            # Parse PTO dates
-                            if isinstance(pto_start, str):
-                                pto_start_dt = datetime.fromisoformat(
-                                    pto_start.replace("Z", "+00:00")
-                                ).date()
-                            elif isinstance(pto_start, date):
-                                pto_start_dt = pto_start
-                            else:
-                                continue
-
-                            if isinstance(pto_end, str):
-                                pto_end_dt = datetime.fromisoformat(
-                                    pto_end.replace("Z", "+00:00")
-                                ).date()
-                            elif isinstance(pto_end, date):
-                                pto_end_dt = pto_end
-                            else:
-                                continue
-
-                            # Check for overlap
-                            if not (
-                                pto_end_dt < check_start_dt
-                                or pto_start_dt > check_end_dt
-                            ):
-                                has_conflict = True
-                                break
-
-                    except Exception as pto_date_error:
-                        print(
-                            f"Warning: Error parsing PTO dates for staffer {staffer_id}: {pto_date_error}"
-                        )
-                        continue
-
-            # If no PTO conflict, check team membership
-            if not has_conflict:
-                # If project IDs are specified, check if staffer is on any of those project teams
-                is_on_project_team = True  # Default to True if no project filtering
-                if project_ids:
-                    team_membership_result = (
-                        supabase_client.table("project_team_memberships")
-                        .select("project_team_id, project_teams!inner(project_id)")
-                        .eq("staffer_id", staffer_id)
-                        .in_("project_teams.project_id", project_ids)
-                        .execute()
-                    )
-
-                    is_on_project_team = bool(team_membership_result.data)
-
-                # Only add if staffer is on the relevant project team(s)
-                if is_on_project_team:
-                    available_staffers.append(
-                        StafferInfo(
-                            staffer_id=staffer["id"],
-                            first_name=staffer["first_name"],
-                            last_name=staffer["last_name"],
-                            title=staffer["title"],
-                            capacity=staffer["capacity"],
-                            time_zone=staffer.get("time_zone"),
-                            seniority_level=(
-                                staffer["seniorities"]["seniority_level"]
-                                if staffer.get("seniorities") and staffer["seniorities"]
-                                else None
-                            ),
-                        )
-                    )
-
-        # Sort by seniority and capacity for better matching
-        available_staffers.sort(
-            key=lambda x: (x.seniority_level or 0, x.capacity), reverse=True
+        staffers = await _fetch_available_staffer_rows(
+            exclude_staffer_id, check_start_dt, check_end_dt, project_ids, limit
         )
 
-        return available_staffers
+        return [_staffer_info(staffer) for staffer in staffers]
 
     except Exception as e:
-        print(f"Error finding available staffers: {e}")
+        logger.exception("Error finding available staffers: %s", e)
         return []
 
 
-@function_tool
 def get_project_ids_from_tasks(task_assignments: List[TaskAssignment]) -> List[str]:
     """
     Extract unique project IDs from a list of task assignments.
@@ -534,9 +486,8 @@ When a staffer takes time off, your job is to:
 
 CRITICAL WORKFLOW:
 1. First, get the affected task assignments for the staffer
-2. Extract the project IDs from those tasks using get_project_ids_from_tasks
-3. Find available staffers using those project IDs to ensure team membership
-4. Create specific NewTaskAssignment recommendations with UUIDs
+2. Find available staffers, passing the project_id values of those tasks to ensure team membership
+3. Create specific NewTaskAssignment recommendations with UUIDs
 
 CRITICAL: Your response must explicitly indicate assignment intentions using the structured models:
 - Use NewTaskAssignment objects to specify exactly which staffer should take over which task
@@ -564,7 +515,6 @@ Assignment Decision Making:
 You have access to database tools to:
 - Find staffers by name
 - Get affected task assignments
-- Extract project IDs from task assignments
 - Find available replacement staffers (filtered by project team membership)
 
 Always provide actionable assignment recommendations with clear reasoning, confidence scores, and proper UUIDs.
@@ -576,13 +526,252 @@ resource_management_agent = Agent(
     model="gpt-4o-mini",
     instructions=RESOURCE_MANAGEMENT_PROMPT,
     tools=[
-        find_staffer_by_name,
-        get_staffer_task_assignments,
-        get_project_ids_from_tasks,
-        find_available_staffers,
+        function_tool(find_staffer_by_name),
+        function_tool(get_staffer_task_assignments),
+        function_tool(find_available_staffers),
     ],
 )
 
+# Same instructions without tools, for runs whose lookups were done up front;
+# it answers in a single model call instead of a tool-calling loop
+reassignment_ranking_agent = resource_management_agent.clone(
+    name="reassignment_ranking_agent", tools=[]
+)
+
+
+# Static part of the agent input. The variable request data is appended as JSON
+# after it, so every input shares a byte-identical prefix the model provider
+# can cache.
+_TIME_OFF_PREFIX = """Process this time-off request and handle task reassignments.
+
+Please:
+1. Find the staffer in the database
+2. Identify affected task assignments during this time period
+3. Find suitable replacement staffers
+4. Create reassignment recommendations
+
+Return a structured ResourceManagementResponse with:
+- success (bool)
+- message (str)
+- affected_tasks_count (int)
+- new_assignments (List[NewTaskAssignment])
+- warnings (List[str])
+- recommendations (List[str])
+
+Time-off request:
+"""
+
+
+def _parse_time_off_request(
+    time_off_data: Union[TimeOffRequest, Dict[str, Any]],
+) -> TimeOffRequest:
+    """Validate time-off input, reusing it as-is if it's already a TimeOffRequest."""
+    if isinstance(time_off_data, TimeOffRequest):
+        return time_off_data
+    return TimeOffRequest.model_validate(time_off_data)
+
+
+def _time_off_message(time_off_request: TimeOffRequest) -> str:
+    """Format a time-off request as the resource management agent's input."""
+    return _TIME_OFF_PREFIX + time_off_request.model_dump_json()
+
+
+# Static part of the input when the lookups have already been done, so the
+# agent only has to weigh the candidates
+_RANKING_PREFIX = """The affected tasks and the available replacement staffers for this
+time-off request have already been looked up; all candidates are on a team of at
+least one affected task's project and have no conflicting time off. Do not look
+anything up again. candidate_project_ids lists, for each candidate staffer_id, the
+affected projects whose team that candidate is on.
+
+For each affected task, pick the best candidate whose candidate_project_ids include
+the task's project_id, keeping each candidate's total estimated hours within their
+capacity, and create a NewTaskAssignment recommendation. If no candidate fits a
+task, explain why in warnings.
+
+Return a structured ResourceManagementResponse with:
+- success (bool)
+- message (str)
+- affected_tasks_count (int)
+- new_assignments (List[NewTaskAssignment])
+- warnings (List[str])
+- recommendations (List[str])
+
+Reassignment context:
+"""
+
+
+def _ranking_message(context: ReassignmentContext) -> str:
+    """Format prefetched lookups as the ranking agent's input."""
+    return _RANKING_PREFIX + context.model_dump_json()
+
+
+# Caps concurrent agent runs; callers wait briefly for a slot and are told the
+# service is busy instead of queueing unbounded LLM calls
+_AGENT_SEM = asyncio.Semaphore(int(os.getenv("AGENT_MAX_CONCURRENCY", "8")))
+_AGENT_ACQUIRE_TIMEOUT = float(os.getenv("AGENT_ACQUIRE_TIMEOUT", "2"))
+SERVICE_BUSY_MESSAGE = "Service busy, please retry shortly"
+
+
+async def _acquire_agent_slot() -> bool:
+    """Wait up to _AGENT_ACQUIRE_TIMEOUT seconds for an agent slot."""
+    try:
+        await asyncio.wait_for(_AGENT_SEM.acquire(), timeout=_AGENT_ACQUIRE_TIMEOUT)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _load_reassignment_context(
+    time_off_request: TimeOffRequest,
+) -> Optional[ReassignmentContext]:
+    """
+    Run the fixed lookup pipeline (staffer, affected tasks, available staffers
+    on those tasks' project teams) directly, without the agent.
+
+    Returns:
+        ReassignmentContext, or None when the staffer or dates can't be resolved
+        and the agent should look things up itself
+
+    Raises:
+        Exception: If the task or candidate lookup fails, so a database error
+            is reported as a failure rather than as "nothing to reassign"
+    """
+    staffer_id = time_off_request.staffer_id
+    staffer_name = time_off_request.staffer_name
+    if not staffer_id:
+        staffer = await find_staffer_by_name(staffer_name)
+        if staffer is None:
+            # Let the agent try to resolve the name
+            return None
+        staffer_id = staffer.staffer_id
+        staffer_name = format_staffer_name(
+            staffer.first_name, staffer.last_name, staffer_name
+        )
+
+    start_date = time_off_request.start_datetime
+    end_date = time_off_request.end_datetime
+    try:
+        check_start_dt = _coerce_date(start_date)
+        check_end_dt = _coerce_date(end_date)
+    except ValueError:
+        return None
+    if not check_start_dt or not check_end_dt:
+        return None
+
+    # The affected tasks and the pool of available staffers don't depend on
+    # each other, so fetch both at once and match candidates to the tasks'
+    # projects in memory
+    tasks, candidate_rows = await asyncio.gather(
+        _load_staffer_task_assignments(staffer_id, start_date, end_date),
+        _fetch_available_staffer_rows(staffer_id, check_start_dt, check_end_dt),
+    )
+
+    project_ids = set(get_project_ids_from_tasks(tasks))
+    candidates = []
+    candidate_project_ids = {}
+    for row in candidate_rows:
+        team_project_ids = project_ids.intersection(row["team_project_ids"])
+        if team_project_ids:
+            candidates.append(_staffer_info(row))
+            candidate_project_ids[row["id"]] = sorted(team_project_ids)
+    return ReassignmentContext.model_construct(
+        staffer_id=staffer_id,
+        staffer_name=staffer_name,
+        start_datetime=start_date,
+        end_datetime=end_date,
+        affected_tasks=tasks,
+        candidates=candidates,
+        candidate_project_ids=candidate_project_ids,
+    )
+
+
+def _deterministic_reassignment(
+    context: ReassignmentContext,
+) -> Optional[ResourceManagementResponse]:
+    """
+    Build the response without the agent when no judgement is needed: no
+    affected tasks, no candidates, or a single candidate.
+
+    Returns:
+        ResourceManagementResponse, or None when the agent should decide
+    """
+    staffer_id = context.staffer_id
+    staffer_name = context.staffer_name
+    tasks = context.affected_tasks
+    candidates = context.candidates
+    if not tasks:
+        return ResourceManagementResponse.model_construct(
+            success=True,
+            message=f"No task assignments for {staffer_name} overlap the time off",
+            affected_tasks_count=0,
+            new_assignments=[],
+            warnings=[],
+            recommendations=[],
+        )
+
+    if len(candidates) > 1:
+        return None
+
+    if not candidates:
+        return ResourceManagementResponse.model_construct(
+            success=True,
+            message=f"No available replacement found for {staffer_name}'s {len(tasks)} affected tasks",
+            affected_tasks_count=len(tasks),
+            new_assignments=[],
+            warnings=[
+                f"No available staffer on the project team can take over '{task.task_name}'"
+                for task in tasks
+            ],
+            recommendations=[],
+        )
+
+    candidate = candidates[0]
+    candidate_name = format_staffer_name(
+        candidate.first_name, candidate.last_name, candidate.staffer_id
+    )
+    # Only hand over tasks on projects whose team the candidate is on
+    team_project_ids = set(context.candidate_project_ids[candidate.staffer_id])
+    assigned_tasks = [task for task in tasks if task.project_id in team_project_ids]
+    warnings = [
+        f"No available staffer on the project team can take over '{task.task_name}'"
+        for task in tasks
+        if task.project_id not in team_project_ids
+    ]
+
+    # Confidence reflects whether the candidate can absorb all the hours handed
+    # over, not each task on its own
+    total_hours = sum(task.estimated_hours or 0 for task in assigned_tasks)
+    confidence = min(1.0, candidate.capacity / total_hours) if total_hours else 1.0
+    if total_hours > candidate.capacity:
+        warnings.append(
+            f"{candidate_name}'s capacity ({candidate.capacity}) is below the {total_hours} estimated hours being reassigned"
+        )
+
+    new_assignments = [
+        NewTaskAssignment(
+            original_staffer_id=staffer_id,
+            original_staffer_name=staffer_name,
+            new_staffer_id=candidate.staffer_id,
+            new_staffer_name=candidate_name,
+            task_id=task.task_id,
+            task_name=task.task_name,
+            project_id=task.project_id,
+            project_name=task.project_name,
+            assignment_reason="Only project team member available during the time off",
+            confidence_score=confidence,
+        )
+        for task in assigned_tasks
+    ]
+    return ResourceManagementResponse.model_construct(
+        success=True,
+        message=f"Reassign {len(assigned_tasks)} of {len(tasks)} tasks from {staffer_name} to {candidate_name}",
+        affected_tasks_count=len(tasks),
+        new_assignments=new_assignments,
+        warnings=warnings,
+        recommendations=[],
+    )
+
 
 async def handle_resource_management(
     time_off_data: Dict[str, Any],
@@ -613,7 +802,7 @@ async def handle_resource_management(
     """
     try:
         # Parse input data into structured model
-        time_off_request = TimeOffRequest(**time_off_data)
+        time_off_request = _parse_time_off_request(time_off_data)
 
         # Emit event for starting time-off processing
         await event_bus.emit(
@@ -624,65 +813,65 @@ async def handle_resource_management(
             )
         )
 
-        # Convert time_off_data to a formatted message string
-        time_off_message = f"""
-        Process this time-off request and handle task reassignments:
-        
-        Staffer: {time_off_request.staffer_name}
-        Time Off Hours: {time_off_request.time_off_hours}
-        Start: {time_off_request.start_datetime}
-        End: {time_off_request.end_datetime}
-        Type: {time_off_request.time_off_type}
-        
-        Please:
-        1. Find the staffer in the database
-        2. Identify affected task assignments during this time period
-        3. Find suitable replacement staffers
-        4. Create reassignment recommendations
-        
-        Return a structured ResourceManagementResponse with:
-        - success (bool)
-        - message (str)
-        - affected_tasks_count (int)
-        - new_assignments (List[NewTaskAssignment])
-        - warnings (List[str])
-        - recommendations (List[str])
-        """
-
-        # Run the agent with the OpenAI Agents SDK
-        from agents import Runner
-
-        result = await Runner.run(
-            agent=resource_management_agent, input=time_off_message
-        )
+        # Do the lookups directly and only involve the agent when there are
+        # several candidates to weigh
+        context = await _load_reassignment_context(time_off_request)
+        response = _deterministic_reassignment(context) if context else None
 
-        # Parse the result into the structured response format
-        response = ResourceManagementResponse(
-            success=True,
-            message=str(result),
-            affected_tasks_count=0,  # This would be parsed from the actual response
-            new_assignments=[],
-            warnings=[],
-            recommendations=[],
-        )
+        if response is None:
+            if context is not None:
+                # The agent only ranks the prefetched candidates
+                agent = reassignment_ranking_agent
+                agent_input = _ranking_message(context)
+            else:
+                agent = resource_management_agent
+                agent_input = _time_off_message(time_off_request)
+
+            if not await _acquire_agent_slot():
+                return ResourceManagementResponse.model_construct(
+                    success=False,
+                    message=SERVICE_BUSY_MESSAGE,
+                    affected_tasks_count=0,
+                    new_assignments=[],
+                    warnings=[SERVICE_BUSY_MESSAGE],
+                    recommendations=[],
+                )
 
-        # Emit events for suggested reassignments
-        for assignment in response.new_assignments:
-            await event_bus.emit(
+            # Run the agent with the OpenAI Agents SDK
+            try:
+                result = await Runner.run(agent, input=agent_input)
+            finally:
+                _AGENT_SEM.release()
+
+            # Parse the result into the structured response format; every field
+            # is passed explicitly, so skip validation and default factories
+            response = ResourceManagementResponse.model_construct(
+                success=True,
+                message=str(result),
+                affected_tasks_count=0,  # This would be parsed from the actual response
+                new_assignments=[],
+                warnings=[],
+                recommendations=[],
+            )
+
+        # Emit events for suggested reassignments and for completing time-off
+        # processing in one batch
+        await event_bus.emit_batch(
+            [
                 BusinessEvent(
                     type=BusinessEventType.UPDATE,
                     message=f"Suggested reassignment: Task '{assignment.task_name}' from {assignment.original_staffer_name} to {assignment.new_staffer_name} (Confidence: {assignment.confidence_score})",
                     agent_id=AgentType.RESOURCE_MANAGEMENT,
                 )
-            )
-
-        # Emit event for completing time-off processing
-        await event_bus.emit(
-            BusinessEvent(
-                type=BusinessEventType.UPDATE,
-                message=f"Completed processing time-off request for {time_off_request.staffer_name}. Found {len(response.new_assignments)} task reassignments.",
-                agent_id=AgentType.RESOURCE_MANAGEMENT,
-            )
+                for assignment in response.new_assignments
+            ]
+            + [
+                BusinessEvent(
+                    type=BusinessEventType.UPDATE,
+                    message=f"Completed processing time-off request for {time_off_request.staffer_name}. Found {len(response.new_assignments)} task reassignments.",
+                    agent_id=AgentType.RESOURCE_MANAGEMENT,
+                )
+            ]
         )
 
         return response
@@ -706,3 +895,37 @@ async def handle_resource_management(
         )
 
         return error_response
+
+
+async def stream_resource_management(
+    time_off_data: Union[TimeOffRequest, Dict[str, Any]],
+) -> AsyncIterator[str]:
+    """
+    Stream the resource management agent's response to a time-off request as it
+    is generated, so callers can forward text without waiting for the full run.
+
+    Args:
+        time_off_data: TimeOffRequest, or a dictionary in the same format accepted
+            by handle_resource_management
+
+    Yields:
+        Text deltas of the agent's response
+    """
+    time_off_request = _parse_time_off_request(time_off_data)
+
+    if not await _acquire_agent_slot():
+        yield SERVICE_BUSY_MESSAGE
+        return
+
+    try:
+        result = Runner.run_streamed(
+            resource_management_agent, input=_time_off_message(time_off_request)
+        )
+
+        async for event in result.stream_events():
+            if event.type == "raw_response_event" and isinstance(
+                event.data, ResponseTextDeltaEvent
+            ):
+                yield event.data.delta
+    finally:
+        _AGENT_SEM.release()
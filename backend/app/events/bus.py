@@ -1,12 +1,25 @@
+import asyncio
+import logging
 from enum import Enum
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Callable, Awaitable, Dict, Any
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Callable, Awaitable, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
 
 class BusinessEventType(Enum):
     TEST = "TEST"
     ERROR = "ERROR"
     UPDATE = "UPDATE"
+    # Orchestrator progress, so subscribers can skip per-step events cheaply
+    ORCHESTRATOR_START = "ORCHESTRATOR_START"
+    HANDOFF = "HANDOFF"
+    # Per-step details, only emitted while DEBUG logging is on
+    TOOL_CALL = "TOOL_CALL"
+    TOOL_OUTPUT = "TOOL_OUTPUT"
+    AGENT_MESSAGE = "AGENT_MESSAGE"
+    ORCHESTRATOR_END = "ORCHESTRATOR_END"
 
 class AgentType(Enum):
     ORCHESTRATOR = "ORCHESTRATOR"
@@ -14,12 +27,15 @@ class AgentType(Enum):
     RESOURCE_MANAGEMENT = "RESOURCE_MANAGEMENT"
     PROFITABILITY = "PROFITABILITY"
 
-@dataclass
+# Events are created for every emit and never modified once sent, so slots keep
+# them small and frozen makes them hashable
+@dataclass(slots=True, frozen=True)
 class BusinessEvent:
     type: BusinessEventType
     message: str
     agent_id: AgentType
-    timestamp: datetime = datetime.now()
+    # Default is evaluated per event; a plain default would be frozen at import
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 class EventBus:
     _instance = None
@@ -27,19 +43,96 @@ class EventBus:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.subscribers: List[Callable[[BusinessEvent], Awaitable[None]]] = []
+            # Subscribers by event type (None = every type). Dicts keep subscription
+            # order and make unsubscribe O(1)
+            cls._instance.subscribers: Dict[Optional[BusinessEventType], Dict[Callable[[BusinessEvent], Awaitable[None]], None]] = defaultdict(dict)
         return cls._instance
     
     async def emit(self, event: BusinessEvent):
-        for subscriber in self.subscribers:
-            await subscriber(event)
+        """Deliver to all subscribers concurrently; a failing subscriber is logged, not raised"""
+        results = await asyncio.gather(*(subscriber(event) for subscriber in self._subscribers_for(event.type)), return_exceptions=True)
+        self._log_failures(results)
+
+    async def emit_batch(self, events: List[BusinessEvent]):
+        """Deliver several events; each subscriber gets them in order, subscribers run concurrently"""
+        per_subscriber: Dict[Callable[[BusinessEvent], Awaitable[None]], List[BusinessEvent]] = {}
+        for event in events:
+            for subscriber in self._subscribers_for(event.type):
+                per_subscriber.setdefault(subscriber, []).append(event)
+
+        async def deliver(subscriber, subscriber_events):
+            for event in subscriber_events:
+                await subscriber(event)
+        results = await asyncio.gather(*(deliver(s, evs) for s, evs in per_subscriber.items()), return_exceptions=True)
+        self._log_failures(results)
+
+    @staticmethod
+    def _log_failures(results: List[Any]):
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Event subscriber failed", exc_info=result)
     
-    def subscribe(self, callback: Callable[[BusinessEvent], Awaitable[None]]):
-        self.subscribers.append(callback)
+    def _subscribers_for(self, event_type: BusinessEventType) -> List[Callable[[BusinessEvent], Awaitable[None]]]:
+        # A callback subscribed to this type and to all events is called once
+        return list(dict.fromkeys([*self.subscribers.get(event_type, ()), *self.subscribers.get(None, ())]))
+
+    def subscribe(self, callback: Callable[[BusinessEvent], Awaitable[None]], event_type: Optional[BusinessEventType] = None):
+        """Subscribe to one event type, or to every event when event_type is None"""
+        self.subscribers[event_type][callback] = None
         
-    def unsubscribe(self, callback: Callable[[BusinessEvent], Awaitable[None]]):
-        if callback in self.subscribers:
-            self.subscribers.remove(callback)
+    def unsubscribe(self, callback: Callable[[BusinessEvent], Awaitable[None]], event_type: Optional[BusinessEventType] = None):
+        bucket = self.subscribers.get(event_type)
+        if bucket is not None:
+            bucket.pop(callback, None)
 
 # Create a singleton instance
-event_bus = EventBus() 
\ No newline at end of file
+event_bus = EventBus()
+
+class EventBatcher:
+    """
+    Buffers events and delivers them together via EventBus.emit_batch, either
+    `window` seconds after the first buffered event or as soon as `max_batch`
+    events are waiting. Call flush() before discarding the batcher.
+    """
+
+    def __init__(self, bus: EventBus = event_bus, window: float = 0.02, max_batch: int = 256):
+        self._bus = bus
+        self._window = window
+        self._max_batch = max_batch
+        self._buffer: List[BusinessEvent] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_now = asyncio.Event()
+
+    async def add(self, event: BusinessEvent):
+        self._buffer.append(event)
+        if len(self._buffer) >= self._max_batch:
+            # Deliver inline so a fast producer waits for slow subscribers
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def flush(self):
+        """Deliver everything buffered so far and wait until it has been emitted"""
+        task = self._flush_task
+        if task is not None:
+            self._flush_now.set()
+            await task
+        await self._emit_buffer()
+
+    async def _flush_after_window(self):
+        try:
+            await asyncio.wait_for(self._flush_now.wait(), timeout=self._window)
+        except asyncio.TimeoutError:
+            pass
+        self._flush_now.clear()
+        self._flush_task = None
+        await self._emit_buffer()
+
+    async def _emit_buffer(self):
+        if not self._buffer:
+            return
+        events, self._buffer = self._buffer, []
+        try:
+            await self._bus.emit_batch(events)
+        except Exception:
+            logger.exception("Error emitting %d batched events", len(events)) 
\ No newline at end of file
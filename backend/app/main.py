@@ -1,8 +1,9 @@
 import asyncio
-import json
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
@@ -11,11 +12,25 @@ from sse_starlette.sse import EventSourceResponse
 
 from .ai.agents.orchestrator import run as orchestrator_run
 from .ai.agents.project_management import handle_project_management
+from .ai.agents.resource_management import (
+    TimeOffRequest,
+    invalidate_staffer_cache,
+    stream_resource_management,
+)
 from .config import agent_config, app_config
 from .events.bus import BusinessEvent, event_bus
 from .models.project import ProjectManagementRequest
+from .utils.logging_config import configure_logging
+from .utils.supabase_client import warm_up_supabase
+
+configure_logging(
+    logging.DEBUG
+    if app_config.DEBUG
+    else logging.INFO if agent_config.ENABLE_LOGGING else logging.WARNING
+)
 
 app = FastAPI()
+logger = logging.getLogger(__name__)
 
 # Configure CORS
 app.add_middleware(
@@ -27,6 +42,12 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def warm_up_connections():
+    """Open the Supabase connection pool before the first request arrives"""
+    await asyncio.to_thread(warm_up_supabase)
+
+
 # Pydantic models for API requests
 class AgentQueryRequest(BaseModel):
     query: str
@@ -97,6 +118,7 @@ async def root():
             "agent_query": "/api/v1/agent/query",
             "project_plan": "/api/v1/agent/project-plan",
             "project_management": "/api/v1/project-management/query",
+            "resource_management_stream": "/api/v1/resource-management/stream",
             "quote": "/api/v1/agent/quote",
             "capacity": "/api/v1/agent/capacity-analysis",
             "time_off_created": "/api/v1/agent/time-off-created",
@@ -166,7 +188,7 @@ async def project_management_query(request: ProjectManagementRequest):
         return {
             "response": result,
             "agent": "project_management",
-            "timestamp": datetime.utcnow().isoformat() + "Z",  # Explicitly mark as UTC
+            "timestamp": datetime.now(timezone.utc).isoformat(),  # Includes UTC offset
         }
     except Exception as e:
         raise HTTPException(
@@ -174,6 +196,17 @@ async def project_management_query(request: ProjectManagementRequest):
         )
 
 
+# Resource Management API endpoints
+@app.post("/api/v1/resource-management/stream")
+async def resource_management_stream(request: TimeOffRequest):
+    """
+    Stream the resource management agent's analysis of a time-off request
+    """
+    return StreamingResponse(
+        stream_resource_management(request), media_type="text/plain"
+    )
+
+
 @app.post("/api/v1/agent/capacity-analysis")
 async def capacity_analysis(request: CapacityAnalysisRequest):
     """
@@ -219,7 +252,7 @@ async def time_off_created(request: StafferTimeOffRequest):
         """
 
         # Trigger orchestrator agent with the time off information
-        asyncio.create_task(orchestrator_run(query))
+        asyncio.create_task(orchestrator_run(query, stream=True))
 
         return {
             "status": "processing",
@@ -233,6 +266,16 @@ async def time_off_created(request: StafferTimeOffRequest):
         )
 
 
+@app.post("/api/v1/agent/staffers-changed")
+async def staffers_changed():
+    """
+    Drop cached staffer lookups after the frontend creates, edits or deletes a
+    staffer, so agents see the change immediately
+    """
+    invalidate_staffer_cache()
+    return {"status": "ok"}
+
+
 # Configuration endpoints
 @app.get("/api/v1/config/agents")
 async def get_agent_config():
@@ -259,6 +302,12 @@ async def get_psa_defaults():
     }
 
 
+# Per-client SSE buffer size, and how long an emitter waits on a full buffer
+# before the event is dropped for that client
+EVENT_QUEUE_SIZE = 256
+EVENT_QUEUE_PUT_TIMEOUT = 0.1
+
+
 @app.get("/api/v1/agent/events")
 async def subscribe_to_events():
     """
@@ -277,10 +326,23 @@ async def subscribe_to_events():
     """
 
     async def event_generator():
-        queue = asyncio.Queue()
+        # Bounded so a slow client can't grow memory without limit. When the
+        # queue is full, emitters wait briefly and the event is then dropped
+        queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
 
         async def handle_event(event: BusinessEvent):
-            await queue.put(event)
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(
+                        queue.put(event), timeout=EVENT_QUEUE_PUT_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Event stream client is behind, dropping event: %.100s",
+                        event.message,
+                    )
 
         event_bus.subscribe(handle_event)
         try:
@@ -291,14 +353,16 @@ async def subscribe_to_events():
                         data = {
                             "type": event.type.value,
                             "agent_id": event.agent_id.value,
-                            "timestamp": event.timestamp.isoformat() + "Z",  # Explicitly mark as UTC
+                            "timestamp": event.timestamp.isoformat().replace("+00:00", "Z"),  # Explicitly mark as UTC
                             "message": event.message,
                         }
                         yield {
                             "event": "message",
                             "id": str(id(event)),
                             "retry": 1000,
-                            "data": json.dumps(data),  # Properly serialize the data
+                            # orjson output is already compact; this runs once
+                            # per event per client
+                            "data": orjson.dumps(data).decode(),
                         }
                 except Exception as e:
                     print(f"Error in event stream: {e}")
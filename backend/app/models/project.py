@@ -227,6 +227,7 @@ class DatabaseResponse(BaseModel):
     success: bool
     message: Optional[str] = None
     error: Optional[str] = None
+    error_code: Optional[str] = None  # TRANSIENT or PERMANENT, see utils.db_errors
 
 
 class ProjectResponse(DatabaseResponse):
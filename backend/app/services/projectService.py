@@ -2,7 +2,7 @@
 Project Service - CRUD operations for projects table using Supabase
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import uuid4
 
@@ -14,6 +14,7 @@ from ..models.project import (
     ProjectStatus,
     ProjectUpdateRequest,
 )
+from ..utils.db_errors import db_error
 from ..utils.supabase_client import supabase_client
 
 
@@ -23,7 +24,9 @@ class ProjectService:
     @staticmethod
     def create_project(project_request: ProjectCreateRequest) -> ProjectResponse:
         """
-        Create a new project in the database.
+        Create a new project in the database. If a project with the same
+        client_id and project_name already exists, its status and dates are
+        updated instead and the message says so.
 
         Args:
             project_request: ProjectCreateRequest with project details
@@ -43,24 +46,58 @@ class ProjectService:
                 "project_status": project_request.project_status,
                 "project_start_date": project_request.project_start_date,
                 "project_due_date": project_request.project_due_date,
-                "created_at": datetime.utcnow().isoformat(),
-                "last_updated_at": datetime.utcnow().isoformat(),
+                "last_updated_at": datetime.now(timezone.utc).isoformat(),
             }
 
-            result = supabase_client.table("projects").insert(project_data).execute()
+            # Insert unless (client_id, project_name) already exists, so agent
+            # retries never create duplicates; only a new row comes back
+            result = (
+                supabase_client.table("projects")
+                .upsert(
+                    project_data,
+                    on_conflict="client_id,project_name",
+                    ignore_duplicates=True,
+                )
+                .execute()
+            )
+
+            if result.data and len(result.data) > 0:
+                project = Project(**result.data[0])
+                return ProjectResponse(
+                    success=True,
+                    project=project,
+                    message=f"Project '{project_request.project_name}' created successfully (project_id: {project.project_id})",
+                )
+
+            # The project already exists: update it and say so, rather than
+            # reporting a new project
+            result = (
+                supabase_client.table("projects")
+                .update(
+                    {
+                        "project_status": project_request.project_status,
+                        "project_start_date": project_request.project_start_date,
+                        "project_due_date": project_request.project_due_date,
+                        "last_updated_at": project_data["last_updated_at"],
+                    }
+                )
+                .eq("client_id", project_request.client_id)
+                .eq("project_name", project_request.project_name)
+                .execute()
+            )
 
             if result.data and len(result.data) > 0:
                 project = Project(**result.data[0])
                 return ProjectResponse(
                     success=True,
                     project=project,
-                    message=f"Project '{project_request.project_name}' created successfully",
+                    message=f"Project '{project_request.project_name}' already exists (project_id: {project.project_id}); updated its status and dates",
                 )
             else:
                 return ProjectResponse(success=False, error="Failed to create project")
 
         except Exception as e:
-            return ProjectResponse(success=False, error=f"Database error: {str(e)}")
+            return ProjectResponse(**db_error(e))
 
     @staticmethod
     def get_project_by_id(project_id: str) -> ProjectResponse:
@@ -93,7 +130,7 @@ class ProjectService:
                 return ProjectResponse(success=False, error="Project not found")
 
         except Exception as e:
-            return ProjectResponse(success=False, error=f"Database error: {str(e)}")
+            return ProjectResponse(**db_error(e))
 
     @staticmethod
     def get_all_projects(limit: Optional[int] = None) -> List[Project]:
@@ -171,7 +208,7 @@ class ProjectService:
                 )
 
             # Add last_updated_at timestamp
-            updates["last_updated_at"] = datetime.utcnow().isoformat()
+            updates["last_updated_at"] = datetime.now(timezone.utc).isoformat()
 
             result = (
                 supabase_client.table("projects")
@@ -193,7 +230,7 @@ class ProjectService:
                 )
 
         except Exception as e:
-            return ProjectResponse(success=False, error=f"Database error: {str(e)}")
+            return ProjectResponse(**db_error(e))
 
     @staticmethod
     def update_project_from_request(
@@ -281,7 +318,7 @@ class ProjectService:
                 )
 
         except Exception as e:
-            return DatabaseResponse(success=False, error=f"Database error: {str(e)}")
+            return DatabaseResponse(**db_error(e))
 
     @staticmethod
     def get_projects_by_status(
@@ -340,7 +377,7 @@ class ProjectService:
             if not supabase_client:
                 return []
 
-            current_date = datetime.utcnow().date().isoformat()
+            current_date = datetime.now(timezone.utc).date().isoformat()
 
             result = (
                 supabase_client.table("projects")
@@ -419,7 +456,7 @@ class ProjectService:
                 )
 
         except Exception as e:
-            return ProjectResponse(success=False, error=f"Database error: {str(e)}")
+            return ProjectResponse(**db_error(e))
 
     @staticmethod
     def search_projects(search_term: str) -> List[Project]:
@@ -2,7 +2,7 @@
 Project Task Service - CRUD operations for project_tasks table using Supabase
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import uuid4
 
@@ -13,6 +13,7 @@ from ..models.project import (
     TaskResponse,
     TaskStatus,
 )
+from ..utils.db_errors import db_error
 from ..utils.supabase_client import supabase_client
 
 
@@ -36,6 +37,7 @@ class ProjectTaskService:
                     success=False, error="Database connection not available"
                 )
 
+            now = datetime.now(timezone.utc).isoformat()
             task_data = {
                 "project_id": task_request.project_id,
                 "project_phase_id": task_request.project_phase_id,
@@ -45,8 +47,8 @@ class ProjectTaskService:
                 "project_task_start_date": task_request.task_start_date,
                 "project_task_due_date": task_request.task_due_date,
                 "estimated_hours": task_request.estimated_hours,
-                "created_at": datetime.utcnow().isoformat(),
-                "last_updated_at": datetime.utcnow().isoformat(),
+                "created_at": now,
+                "last_updated_at": now,
             }
 
             result = supabase_client.table("project_tasks").insert(task_data).execute()
@@ -62,7 +64,7 @@ class ProjectTaskService:
                 return TaskResponse(success=False, error="Failed to create task")
 
         except Exception as e:
-            return TaskResponse(success=False, error=f"Database error: {str(e)}")
+            return TaskResponse(**db_error(e))
 
     @staticmethod
     def get_task_by_id(task_id: str) -> TaskResponse:
@@ -95,7 +97,7 @@ class ProjectTaskService:
                 return TaskResponse(success=False, error="Task not found")
 
         except Exception as e:
-            return TaskResponse(success=False, error=f"Database error: {str(e)}")
+            return TaskResponse(**db_error(e))
 
     @staticmethod
     def get_task_by_name(
@@ -166,31 +168,49 @@ class ProjectTaskService:
                 )
 
         except Exception as e:
-            return TaskResponse(success=False, error=f"Database error: {str(e)}")
+            return TaskResponse(**db_error(e))
 
     @staticmethod
-    def get_tasks_by_project(project_id: str) -> List[ProjectTask]:
+    def get_tasks_by_project(
+        project_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[ProjectTask]:
         """
-        Retrieve all tasks for a specific project.
+        Retrieve tasks for a specific project, optionally one page at a time.
 
         Args:
             project_id: UUID of the project
+            limit: Optional maximum number of tasks to retrieve (must be positive)
+            offset: Number of tasks to skip (must not be negative)
 
         Returns:
             List of ProjectTask objects
+
+        Raises:
+            ValueError: If limit is not positive or offset is negative
         """
+        if limit is not None and limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+
         try:
             if not supabase_client:
                 return []
 
-            result = (
+            query = (
                 supabase_client.table("project_tasks")
                 .select("*")
                 .eq("project_id", project_id)
                 .order("created_at")
-                .execute()
             )
 
+            if limit is not None:
+                query = query.range(offset, offset + limit - 1)
+            elif offset:
+                query = query.offset(offset)
+
+            result = query.execute()
+
             return [ProjectTask(**task) for task in (result.data or [])]
 
         except Exception as e:
@@ -245,7 +265,7 @@ class ProjectTaskService:
                 )
 
             # Add last_updated_at timestamp
-            updates["last_updated_at"] = datetime.utcnow().isoformat()
+            updates["last_updated_at"] = datetime.now(timezone.utc).isoformat()
 
             result = (
                 supabase_client.table("project_tasks")
@@ -267,7 +287,7 @@ class ProjectTaskService:
                 )
 
         except Exception as e:
-            return TaskResponse(success=False, error=f"Database error: {str(e)}")
+            return TaskResponse(**db_error(e))
 
     @staticmethod
     def update_task_status(task_id: str, status: TaskStatus) -> TaskResponse:
@@ -349,7 +369,7 @@ class ProjectTaskService:
                 )
 
         except Exception as e:
-            return DatabaseResponse(success=False, error=f"Database error: {str(e)}")
+            return DatabaseResponse(**db_error(e))
 
     @staticmethod
     def get_tasks_by_status(
@@ -401,7 +421,7 @@ class ProjectTaskService:
             if not supabase_client:
                 return []
 
-            current_date = datetime.utcnow().date().isoformat()
+            current_date = datetime.now(timezone.utc).date().isoformat()
 
             query = (
                 supabase_client.table("project_tasks")
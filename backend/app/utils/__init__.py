@@ -2,6 +2,11 @@
 Utilities package for PSA Agent Backend
 """
 
-from .supabase_client import get_supabase_client, supabase_client
+from .supabase_client import (
+    execute_fast,
+    get_supabase_client,
+    supabase_client,
+    warm_up_supabase,
+)
 
-__all__ = ["get_supabase_client", "supabase_client"]
+__all__ = ["execute_fast", "get_supabase_client", "supabase_client", "warm_up_supabase"]
@@ -0,0 +1,197 @@
+"""
+Database error classification and retry helpers for Supabase calls
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+import httpx
+from postgrest.exceptions import APIError
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+    wait_exponential_jitter,
+)
+
+from ..models.project import DatabaseResponse
+
+TRANSIENT = "TRANSIENT"
+PERMANENT = "PERMANENT"
+
+# SQLSTATE classes worth retrying: connection exceptions, transaction
+# rollbacks (serialization failures, deadlocks), insufficient resources
+# and operator intervention (statement timeouts, admin shutdown)
+_TRANSIENT_SQLSTATE_CLASSES = ("08", "40", "53", "57")
+
+# HTTP statuses from the Supabase gateway that mean "try again later"
+_TRANSIENT_HTTP_STATUSES = (429, 502, 503, 504)
+
+ResponseT = TypeVar("ResponseT", bound=DatabaseResponse)
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Supabase while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Opens after `fail_max` consecutive transient failures and rejects calls for
+    `reset_timeout` seconds, so a Supabase outage fails fast instead of every
+    caller waiting out its retries. After the timeout one call is let through;
+    its success closes the breaker again.
+    """
+
+    def __init__(self, fail_max: int = 10, reset_timeout: float = 30.0):
+        self._fail_max = fail_max
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if calls are currently rejected."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                raise CircuitOpenError("Database temporarily unavailable")
+            # Half-open: let this call through and restart the timeout, so
+            # concurrent callers keep failing fast until it succeeds
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._fail_max:
+                self._opened_at = time.monotonic()
+
+
+# Shared by every call made through run_query. Writes and the service classes
+# call Supabase directly and don't go through it
+supabase_breaker = CircuitBreaker()
+
+
+def classify_db_error(e: Exception) -> str:
+    """
+    Classify a database exception as TRANSIENT (safe to retry) or PERMANENT.
+
+    Args:
+        e: Exception raised by a Supabase/PostgREST call
+
+    Returns:
+        TRANSIENT or PERMANENT
+    """
+    if isinstance(e, (httpx.TransportError, httpx.TimeoutException, CircuitOpenError)):
+        return TRANSIENT
+    if isinstance(e, httpx.HTTPStatusError):
+        return (
+            TRANSIENT
+            if e.response.status_code in _TRANSIENT_HTTP_STATUSES
+            else PERMANENT
+        )
+    if isinstance(e, APIError) and e.code:
+        code = str(e.code)
+        # postgrest-py puts the HTTP status in code when the error body isn't
+        # JSON (e.g. a gateway error page); SQLSTATEs are five characters
+        if len(code) == 3 and code.isdigit():
+            return TRANSIENT if int(code) in _TRANSIENT_HTTP_STATUSES else PERMANENT
+        return TRANSIENT if code.startswith(_TRANSIENT_SQLSTATE_CLASSES) else PERMANENT
+    return PERMANENT
+
+
+def db_error(e: Exception) -> Dict[str, Any]:
+    """
+    Build the fields of a failed DatabaseResponse from an exception.
+
+    Args:
+        e: Exception raised by a Supabase/PostgREST call
+
+    Returns:
+        Dict with success, error_code and error, suitable for Response(**...)
+    """
+    return {
+        "success": False,
+        "error_code": classify_db_error(e),
+        "error": f"Database error: {str(e)}",
+    }
+
+
+def _is_transient(response: DatabaseResponse) -> bool:
+    return response.error_code == TRANSIENT
+
+
+async def retry_transient(func: Callable[..., ResponseT], *args: Any) -> ResponseT:
+    """
+    Call a blocking service method in a worker thread, retrying with exponential
+    backoff while it reports a TRANSIENT error, so agents only see failures that
+    retrying won't fix and the event loop is never blocked on Supabase I/O.
+
+    Args:
+        func: Service method returning a DatabaseResponse
+        *args: Arguments passed to func
+
+    Returns:
+        The last response returned by func
+    """
+
+    async def attempt() -> ResponseT:
+        return await asyncio.to_thread(func, *args)
+
+    retrying = AsyncRetrying(
+        retry=retry_if_result(_is_transient),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.2, max=2),
+        retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+    )
+    return await retrying(attempt)
+
+
+def _is_transient_error(e: BaseException) -> bool:
+    return isinstance(e, Exception) and classify_db_error(e) == TRANSIENT
+
+
+async def run_query(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking Supabase call (e.g. a request builder's execute, or
+    execute_fast) in a worker thread. Transient errors are retried with jittered
+    exponential backoff so concurrent callers don't retry in lockstep, and the
+    shared circuit breaker makes calls fail fast during an outage.
+
+    Args:
+        func: Blocking function performing the request
+        *args: Arguments passed to func
+
+    Returns:
+        Whatever func returns
+
+    Raises:
+        CircuitOpenError: If the breaker is open
+        Exception: The last error from func once retries are exhausted
+    """
+    supabase_breaker.check()
+
+    retrying = AsyncRetrying(
+        retry=retry_if_exception(_is_transient_error),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.1, max=2),
+        reraise=True,
+    )
+    try:
+        result = await retrying(asyncio.to_thread, func, *args)
+    except Exception as e:
+        if _is_transient_error(e):
+            supabase_breaker.record_failure()
+        raise
+    supabase_breaker.record_success()
+    return result
@@ -0,0 +1,24 @@
+"""
+Formatting helpers shared by the agent tools
+"""
+
+from typing import Optional
+
+
+def format_staffer_name(
+    first_name: Optional[str], last_name: Optional[str], default: str
+) -> str:
+    """
+    Build a staffer's display name from nullable name columns.
+
+    Args:
+        first_name: Staffer first name (may be None or empty)
+        last_name: Staffer last name (may be None or empty)
+        default: Value to return when both names are missing, e.g. the staffer ID
+
+    Returns:
+        "First Last", whichever part is present, or default
+    """
+    if first_name and last_name:
+        return first_name + " " + last_name
+    return first_name or last_name or default
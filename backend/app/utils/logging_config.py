@@ -0,0 +1,41 @@
+"""
+Logging setup for the backend
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send all "app.*" logs through a QueueHandler. Request handlers and the
+    event loop only enqueue records; a QueueListener thread formats and writes
+    them, so log output never blocks on stdout. Safe to call more than once.
+
+    Args:
+        level: Minimum level for app loggers
+    """
+    global _listener
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
@@ -19,6 +19,27 @@ export interface UpdateStafferData extends Partial<CreateStafferData> {
 class StafferService {
    private supabase = createClient();
 
+   // Tell the backend its cached staffer lookups are stale. Best effort: a
+   // failure only means agents see the old row until the cache expires
+   private async notifyStaffersChanged() {
+      try {
+         const response = await fetch("/api/v1/agent/staffers-changed", {
+            method: "POST",
+         });
+         if (!response.ok) {
+            console.warn(
+               "Backend staffer cache invalidation failed:",
+               response.status
+            );
+         }
+      } catch (notificationError) {
+         console.warn(
+            "Failed to notify backend about staffer change:",
+            notificationError
+         );
+      }
+   }
+
    // Get all staffers
    async getAllStaffers() {
       try {
@@ -81,6 +102,8 @@ class StafferService {
             throw new Error(`Failed to create staffer: ${error.message}`);
          }
 
+         await this.notifyStaffersChanged();
+
          return { data: data as Staffer, error: null };
       } catch (error) {
          return {
@@ -111,6 +134,8 @@ class StafferService {
             throw new Error(`Failed to update staffer: ${error.message}`);
          }
 
+         await this.notifyStaffersChanged();
+
          return { data: data as Staffer, error: null };
       } catch (error) {
          return {
@@ -135,6 +160,8 @@ class StafferService {
             throw new Error(`Failed to delete staffer: ${error.message}`);
          }
 
+         await this.notifyStaffersChanged();
+
          return { success: true, error: null };
       } catch (error) {
          return {
@@ -1,4 +1,13 @@
-export type BusinessEventType = "TEST" | "ERROR" | "UPDATE";
+export type BusinessEventType =
+   | "TEST"
+   | "ERROR"
+   | "UPDATE"
+   | "ORCHESTRATOR_START"
+   | "HANDOFF"
+   | "TOOL_CALL"
+   | "TOOL_OUTPUT"
+   | "AGENT_MESSAGE"
+   | "ORCHESTRATOR_END";
 
 export type AgentType =
    | "ORCHESTRATOR"
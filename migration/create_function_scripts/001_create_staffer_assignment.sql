@@ -0,0 +1,53 @@
+-- Validate staffer and task, insert the assignment and return the names
+-- needed for event messages, all in a single round trip. Relies on the
+-- unique (staffer_id, project_task_id) index for duplicate detection;
+-- created is false when the assignment already existed.
+drop function if exists public.create_staffer_assignment (uuid, uuid);
+
+create or replace function public.create_staffer_assignment (
+  p_staffer_id uuid,
+  p_project_task_id uuid
+) returns table (
+  staffer_assignment_id uuid,
+  created boolean,
+  staffer_first_name text,
+  staffer_last_name text,
+  project_task_name text
+) language plpgsql as $$
+declare
+  v_first_name text;
+  v_last_name text;
+  v_task_name text;
+  v_assignment_id uuid;
+begin
+  select s.first_name, s.last_name into v_first_name, v_last_name
+  from public.staffers s
+  where s.id = p_staffer_id;
+  if not found then
+    raise exception 'Staffer % not found', p_staffer_id using errcode = 'P0002';
+  end if;
+
+  select t.project_task_name into v_task_name
+  from public.project_tasks t
+  where t.project_task_id = p_project_task_id;
+  if not found then
+    raise exception 'Task % not found', p_project_task_id using errcode = 'P0002';
+  end if;
+
+  insert into public.staffer_assignments (staffer_id, project_task_id)
+  values (p_staffer_id, p_project_task_id)
+  on conflict (staffer_id, project_task_id) do nothing
+  returning staffer_assignments.staffer_assignment_id into v_assignment_id;
+
+  if v_assignment_id is not null then
+    return query select v_assignment_id, true, v_first_name, v_last_name, v_task_name;
+    return;
+  end if;
+
+  return query
+  select sa.staffer_assignment_id, false, v_first_name, v_last_name, v_task_name
+  from public.staffer_assignments sa
+  where sa.staffer_id = p_staffer_id
+    and sa.project_task_id = p_project_task_id;
+end;
+$$;
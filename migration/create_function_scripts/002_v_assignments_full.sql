@@ -0,0 +1,22 @@
+-- Flat view of staffer assignments with their task, project and staffer,
+-- so callers get everything in one round trip without nested embeds
+create or replace view public.v_assignments_full as
+select
+  sa.staffer_assignment_id,
+  sa.staffer_id,
+  sa.project_task_id,
+  sa.created_at,
+  sa.last_updated_at,
+  pt.project_id,
+  pt.project_task_name,
+  pt.project_task_status,
+  pt.project_task_start_date,
+  pt.project_task_due_date,
+  pt.estimated_hours,
+  p.project_name,
+  s.first_name,
+  s.last_name
+from public.staffer_assignments sa
+  join public.project_tasks pt on pt.project_task_id = sa.project_task_id
+  join public.projects p on p.project_id = pt.project_id
+  join public.staffers s on s.id = sa.staffer_id;
@@ -0,0 +1,54 @@
+-- Leading YYYY-MM-DD of an ISO text date as a date, or null when it is missing
+-- or not a real date (e.g. 2024-02-30), instead of raising 22008.
+create or replace function public.safe_date (p_value text) returns date
+language plpgsql immutable as $$
+begin
+  return left(p_value, 10)::date;
+exception
+  when others then
+    return null;
+end;
+$$;
+
+-- A staffer's assignments whose task period overlaps [p_start, p_end], so only
+-- affected rows leave the database. Task dates are stored as ISO text; only the
+-- leading YYYY-MM-DD is compared. Tasks without usable dates are treated as
+-- overlapping, and a null period returns every assignment.
+create or replace function public.staffer_tasks_overlapping (
+  p_staffer_id uuid,
+  p_start date default null,
+  p_end date default null
+) returns table (
+  project_task_id uuid,
+  project_task_name text,
+  project_id uuid,
+  project_name text,
+  estimated_hours bigint,
+  project_task_start_date text,
+  project_task_due_date text,
+  first_name text,
+  last_name text
+) language sql stable as $$
+  select
+    v.project_task_id,
+    v.project_task_name,
+    v.project_id,
+    v.project_name,
+    v.estimated_hours,
+    v.project_task_start_date,
+    v.project_task_due_date,
+    v.first_name,
+    v.last_name
+  from public.v_assignments_full v
+  where v.staffer_id = p_staffer_id
+    and (
+      p_start is null
+      or p_end is null
+      or public.safe_date(v.project_task_start_date) is null
+      or public.safe_date(v.project_task_due_date) is null
+      or (
+        public.safe_date(v.project_task_start_date) <= p_end
+        and public.safe_date(v.project_task_due_date) >= p_start
+      )
+    );
+$$;
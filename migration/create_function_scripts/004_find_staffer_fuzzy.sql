@@ -0,0 +1,27 @@
+-- Closest staffers to a partial or misspelled name, best match first. Uses
+-- word similarity so a single first or last name matches the full name; the
+-- name expression matches staffers_name_trgm_idx so the index is used.
+create or replace function public.find_staffer_fuzzy (q text, max_results int default 5)
+returns table (
+  id uuid,
+  first_name text,
+  last_name text,
+  title text,
+  capacity double precision,
+  time_zone text,
+  seniority_level bigint
+) language sql stable as $$
+  select
+    s.id,
+    s.first_name,
+    s.last_name,
+    s.title,
+    s.capacity,
+    s.time_zone,
+    se.seniority_level
+  from public.staffers s
+    join public.seniorities se on se.seniority_id = s.seniority_id
+  where q <% (coalesce(s.first_name, '') || ' ' || coalesce(s.last_name, ''))
+  order by word_similarity(q, coalesce(s.first_name, '') || ' ' || coalesce(s.last_name, '')) desc
+  limit max_results;
+$$;
@@ -0,0 +1,59 @@
+-- Replacement candidates for a staffer's time off, best match first: staffers
+-- with capacity and no time off overlapping [p_start, p_end] (compared as whole
+-- days), optionally only members of the given projects' teams. Each row carries
+-- the projects of the staffer's teams so callers can match tasks in memory. A
+-- null max_results returns every candidate.
+create or replace function public.find_replacement_candidates (
+  p_exclude_staffer_id uuid,
+  p_start date,
+  p_end date,
+  p_project_ids uuid[] default null,
+  max_results int default null
+) returns table (
+  id uuid,
+  first_name text,
+  last_name text,
+  title text,
+  capacity double precision,
+  time_zone text,
+  seniority_level bigint,
+  team_project_ids uuid[]
+) language sql stable as $$
+  select
+    s.id,
+    s.first_name,
+    s.last_name,
+    s.title,
+    s.capacity,
+    s.time_zone,
+    se.seniority_level,
+    array(
+      select distinct pt.project_id
+      from public.project_team_memberships m
+        join public.project_teams pt on pt.project_team_id = m.project_team_id
+      where m.staffer_id = s.id
+    ) as team_project_ids
+  from public.staffers s
+    join public.seniorities se on se.seniority_id = s.seniority_id
+  where s.id <> p_exclude_staffer_id
+    and s.capacity > 0
+    and not exists (
+      select 1
+      from public.staffer_time_off t
+      where t.staffer_id = s.id
+        and t.time_off_start_datetime < p_end + 1
+        and t.time_off_end_datetime >= p_start
+    )
+    and (
+      p_project_ids is null
+      or exists (
+        select 1
+        from public.project_team_memberships m
+          join public.project_teams pt on pt.project_team_id = m.project_team_id
+        where m.staffer_id = s.id
+          and pt.project_id = any (p_project_ids)
+      )
+    )
+  order by se.seniority_level desc, s.capacity desc
+  limit max_results;
+$$;
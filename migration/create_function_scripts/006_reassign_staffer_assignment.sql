@@ -0,0 +1,73 @@
+-- Move a task from one staffer to another in a single transaction: validate
+-- the new staffer and the task, insert the new assignment, then delete the old
+-- one. If the insert fails nothing is deleted, so the task is never left
+-- unassigned. Returns the names needed for event messages; created is false
+-- when the new staffer already had the task, removed is false when the old
+-- staffer didn't.
+drop function if exists public.reassign_staffer_assignment (uuid, uuid, uuid);
+
+create or replace function public.reassign_staffer_assignment (
+  p_project_task_id uuid,
+  p_old_staffer_id uuid,
+  p_new_staffer_id uuid
+) returns table (
+  created boolean,
+  removed boolean,
+  project_task_name text,
+  old_staffer_first_name text,
+  old_staffer_last_name text,
+  new_staffer_first_name text,
+  new_staffer_last_name text
+) language plpgsql as $$
+declare
+  v_new_first_name text;
+  v_new_last_name text;
+  v_old_first_name text;
+  v_old_last_name text;
+  v_task_name text;
+  v_assignment_id uuid;
+  v_removed_id uuid;
+begin
+  if p_old_staffer_id = p_new_staffer_id then
+    raise exception 'Old and new staffer are the same (%)', p_new_staffer_id
+      using errcode = '22023';
+  end if;
+
+  select s.first_name, s.last_name into v_new_first_name, v_new_last_name
+  from public.staffers s
+  where s.id = p_new_staffer_id;
+  if not found then
+    raise exception 'Staffer % not found', p_new_staffer_id using errcode = 'P0002';
+  end if;
+
+  select t.project_task_name into v_task_name
+  from public.project_tasks t
+  where t.project_task_id = p_project_task_id;
+  if not found then
+    raise exception 'Task % not found', p_project_task_id using errcode = 'P0002';
+  end if;
+
+  select s.first_name, s.last_name into v_old_first_name, v_old_last_name
+  from public.staffers s
+  where s.id = p_old_staffer_id;
+
+  insert into public.staffer_assignments (staffer_id, project_task_id)
+  values (p_new_staffer_id, p_project_task_id)
+  on conflict (staffer_id, project_task_id) do nothing
+  returning staffer_assignments.staffer_assignment_id into v_assignment_id;
+
+  delete from public.staffer_assignments sa
+  where sa.staffer_id = p_old_staffer_id
+    and sa.project_task_id = p_project_task_id
+  returning sa.staffer_assignment_id into v_removed_id;
+
+  return query select
+    v_assignment_id is not null,
+    v_removed_id is not null,
+    v_task_name,
+    v_old_first_name,
+    v_old_last_name,
+    v_new_first_name,
+    v_new_last_name;
+end;
+$$;
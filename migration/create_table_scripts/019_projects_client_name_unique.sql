@@ -0,0 +1,19 @@
+-- Existing duplicate (client_id, project_name) rows make the unique index fail.
+-- They are not removed automatically because tasks, phases and teams reference
+-- projects by id; rename or merge them first. This check stops the migration
+-- with the query to find them instead of a bare unique violation.
+do $$
+begin
+  if exists (
+    select 1
+    from public.projects
+    group by client_id, project_name
+    having count(*) > 1
+  ) then
+    raise exception 'public.projects has duplicate (client_id, project_name) rows; rename or merge them before adding projects_client_id_project_name_key'
+      using hint = 'select client_id, project_name, count(*) from public.projects group by 1, 2 having count(*) > 1';
+  end if;
+end;
+$$;
+
+create unique index if not exists projects_client_id_project_name_key on public.projects using btree (client_id, project_name) TABLESPACE pg_default;
@@ -0,0 +1,13 @@
+-- Assignments used to be inserted without a duplicate check, so remove repeated
+-- (staffer_id, project_task_id) rows first, keeping the earliest. Nothing
+-- references staffer_assignment_id, so the extra rows can be deleted. Without
+-- this the index fails to build and every "on conflict (staffer_id,
+-- project_task_id)" write loses its arbiter index.
+delete from public.staffer_assignments a
+using public.staffer_assignments b
+where a.staffer_id = b.staffer_id
+  and a.project_task_id = b.project_task_id
+  and (coalesce(a.created_at, 'infinity'), a.staffer_assignment_id)
+    > (coalesce(b.created_at, 'infinity'), b.staffer_assignment_id);
+
+create unique index if not exists staffer_assignments_staffer_id_project_task_id_key on public.staffer_assignments using btree (staffer_id, project_task_id) TABLESPACE pg_default;
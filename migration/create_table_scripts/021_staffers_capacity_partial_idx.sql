@@ -0,0 +1 @@
+create index if not exists staffers_capacity_idx on public.staffers using btree (capacity desc) TABLESPACE pg_default where capacity > 0;
@@ -0,0 +1,3 @@
+create extension if not exists pg_trgm;
+
+create index if not exists staffers_name_trgm_idx on public.staffers using gin ((coalesce(first_name, '') || ' ' || coalesce(last_name, '')) gin_trgm_ops) TABLESPACE pg_default;
@@ -0,0 +1,5 @@
+create index if not exists staffer_time_off_staffer_id_idx on public.staffer_time_off using btree (staffer_id) include (time_off_start_datetime, time_off_end_datetime) TABLESPACE pg_default;
+
+create index if not exists project_team_memberships_staffer_team_idx on public.project_team_memberships using btree (staffer_id, project_team_id) TABLESPACE pg_default;
+
+create index if not exists project_teams_project_id_idx on public.project_teams using btree (project_id) include (project_team_id) TABLESPACE pg_default;
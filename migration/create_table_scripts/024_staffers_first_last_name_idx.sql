@@ -0,0 +1 @@
+create index if not exists staffers_first_last_name_idx on public.staffers using btree (first_name, last_name) TABLESPACE pg_default;